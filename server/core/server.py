@@ -1,9 +1,16 @@
 """Main server class that ties everything together."""
 
 import asyncio
+import functools
+import json
+import time
+from datetime import datetime
 from pathlib import Path
 
-import json
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
 
 from .tick import TickScheduler
 from .presence import PresenceTracker
@@ -12,6 +19,7 @@ from ..persistence.database import Database
 from ..auth.auth import AuthManager
 from ..tables.manager import TableManager
 from ..users.network_user import NetworkUser
+from ..users.bot import Bot
 from ..users.base import MenuItem, EscapeBehavior
 from ..users.preferences import UserPreferences, DiceKeepingStyle
 from ..games.registry import GameRegistry, get_game_class
@@ -135,7 +143,6 @@ class Server:
 
     def _load_tables(self) -> None:
         """Load tables from database and restore their games."""
-        from ..users.bot import Bot
 
         tables = self._db.load_all_tables()
         for table in tables:
@@ -196,16 +203,14 @@ class Server:
             if messages and self._ws_server:
                 client = self._ws_server.get_client_by_username(username)
                 if client:
-                    for msg in messages:
-                        asyncio.create_task(client.send(msg))
+                    # One task per user per tick rather than one per packet
+                    asyncio.create_task(client.send_batch(messages))
 
     def _update_status_file(self) -> None:
         """Write current server status to JSON file for external monitoring."""
         if not self._status_file:
             return
-        
-        import time
-        
+
         status_data = {
             "version": VERSION,
             "online": True,
@@ -750,12 +755,13 @@ class Server:
 
         # Check if user is in a table - delegate all events to game
         table = self._tables.find_user_table(username)
-        if table and table.game:
-            player = table.game.get_player_by_id(user.uuid)
+        game = table.game if table else None
+        if game:
+            player = game.get_player_by_id(user.uuid)
             if player:
-                table.game.handle_event(player, packet)
+                game.handle_event(player, packet)
                 # Check if player left the game (user replaced by bot or removed)
-                game_user = table.game._users.get(user.uuid)
+                game_user = game._users.get(user.uuid)
                 if game_user is not user:
                     table.remove_member(username)
                     self._show_main_menu(user)
@@ -1098,7 +1104,7 @@ class Server:
         if selection_id == "restore":
             await self._restore_saved_table(user, save_id)
         elif selection_id == "delete":
-            self._db.delete_saved_table(save_id)
+            await asyncio.to_thread(self._db.delete_saved_table, save_id)
             user.speak_l("saved-table-deleted")
             self._show_saved_tables_menu(user)
         elif selection_id == "back":
@@ -1116,9 +1122,6 @@ class Server:
 
     async def _restore_saved_table(self, user: NetworkUser, save_id: int) -> None:
         """Restore a saved table."""
-        import json
-        from ..users.bot import Bot
-
         record = self._db.get_saved_table(save_id)
         if not record:
             user.speak_l("table-not-exists")
@@ -1133,20 +1136,27 @@ class Server:
             return
 
         # Parse members from saved state
-        members_data = json.loads(record.members_json)
-        human_players = [m for m in members_data if not m.get("is_bot", False)]
+        if orjson is not None:
+            members_data = orjson.loads(record.members_json)
+        else:
+            members_data = json.loads(record.members_json)
 
-        # Check all human players are available
+        # Check all human players are available, resolving their users once
+        # (bots resolve to None)
+        users = self._users
+        resolved: list[tuple[str, NetworkUser | None]] = []
         missing_players = []
-        for member in human_players:
+        for member in members_data:
             member_username = member.get("username")
-            if member_username not in self._users:
+            if member.get("is_bot", False):
+                resolved.append((member_username, None))
+                continue
+            member_user = users.get(member_username)
+            # They must be online and not already in a table
+            if member_user is None or self._tables.find_user_table(member_username):
                 missing_players.append(member_username)
             else:
-                # Check they're not already in a table
-                existing_table = self._tables.find_user_table(member_username)
-                if existing_table:
-                    missing_players.append(member_username)
+                resolved.append((member_username, member_user))
 
         if missing_players:
             user.speak_l("missing-players", players=", ".join(missing_players))
@@ -1168,29 +1178,25 @@ class Server:
         # Attach users and transfer all human players
         # NOTE: We must attach users by player.id (UUID), not by username.
         # The deserialized game has player objects with their original IDs.
-        for member in members_data:
-            member_username = member.get("username")
-            is_bot = member.get("is_bot", False)
-
+        user_states = self._user_states
+        for member_username, member_user in resolved:
             # Find the player object by name to get their ID
             player = game.get_player_by_name(member_username)
             if not player:
                 continue
 
-            if is_bot:
+            if member_user is None:
                 # Recreate bot with the player's original ID
                 bot_user = Bot(member_username, uuid=player.id)
                 game.attach_user(player.id, bot_user)
             else:
                 # Attach human user by player ID
-                member_user = self._users.get(member_username)
-                if member_user:
-                    table.add_member(member_username, member_user, as_spectator=False)
-                    game.attach_user(player.id, member_user)
-                    self._user_states[member_username] = {
-                        "menu": "in_game",
-                        "table_id": table.table_id,
-                    }
+                table.add_member(member_username, member_user, as_spectator=False)
+                game.attach_user(player.id, member_user)
+                user_states[member_username] = {
+                    "menu": "in_game",
+                    "table_id": table.table_id,
+                }
 
         # Setup keybinds (runtime only, not serialized)
         # Action sets are already restored from serialization
@@ -1203,7 +1209,7 @@ class Server:
         game.broadcast_l("table-restored")
 
         # Delete the saved table now that it's been restored
-        self._db.delete_saved_table(save_id)
+        await asyncio.to_thread(self._db.delete_saved_table, save_id)
 
     def _show_leaderboards_menu(self, user: NetworkUser) -> None:
         """Show leaderboards game selection menu."""
@@ -1297,7 +1303,6 @@ class Server:
     def _get_game_results(self, game_type: str) -> list:
         """Get game results as GameResult objects."""
         from ..game_utils.game_result import GameResult, PlayerResult
-        import json
 
         results = self._db.get_game_stats(game_type, limit=100)
         game_results = []
@@ -2125,9 +2130,6 @@ class Server:
 
     def on_table_save(self, table, username: str) -> None:
         """Handle table save request. Called by TableManager."""
-        import json
-        from datetime import datetime
-
         game = table.game
         if not game:
             return
@@ -2139,29 +2141,65 @@ class Server:
         game_json = game.to_json()
 
         # Build members list (includes bot status)
-        members_data = []
-        for player in game.players:
-            members_data.append(
-                {
-                    "username": player.name,
-                    "is_bot": player.is_bot,
-                }
-            )
-        members_json = json.dumps(members_data)
+        members_data = [
+            {"username": player.name, "is_bot": player.is_bot}
+            for player in game.players
+        ]
+        if orjson is not None:
+            members_json = orjson.dumps(members_data).decode()
+        else:
+            members_json = json.dumps(members_data)
 
-        # Save to database
-        self._db.save_user_table(
+        # Save to database off the event loop; the commit can block on disk I/O,
+        # and the table is only destroyed once the save has succeeded
+        save = functools.partial(
+            self._db.save_user_table,
             username=username,
             save_name=save_name,
             game_type=table.game_type,
             game_json=game_json,
             members_json=members_json,
         )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. from the CLI): save inline
+            try:
+                save()
+            except Exception as e:
+                self._on_table_save_failed(username, e)
+                return
+            self._close_saved_table(game)
+        else:
+            loop.create_task(self._save_table_and_close(game, username, save))
+
+    async def _save_table_and_close(self, game, username: str, save) -> None:
+        """Run a saved-table write in a worker thread, then close the table.
+
+        The table is only destroyed once the save has been committed, so a
+        failed write never loses the game.
+        """
+        try:
+            await asyncio.to_thread(save)
+        except Exception as e:
+            self._on_table_save_failed(username, e)
+            return
+        self._close_saved_table(game)
 
-        # Broadcast save message and destroy the table
+    def _close_saved_table(self, game) -> None:
+        """Broadcast the save message and destroy the saved table."""
+        if game._destroyed:
+            return  # Closed some other way while the save was running
         game.broadcast_l("table-saved-destroying")
         game.destroy()
 
+    def _on_table_save_failed(self, username: str, error: Exception) -> None:
+        """Report a failed table save; the table stays open."""
+        print(f"Failed to save table for {username}: {error}")
+        user = self._users.get(username)
+        if user:
+            user.speak_l("table-save-failed")
+
     async def _handle_keybind(self, client: ClientConnection, packet: dict) -> None:
         """Handle keybind press."""
         username = client.username
@@ -2170,12 +2208,13 @@ class Server:
 
         user = self._users.get(username)
         table = self._tables.find_user_table(username)
-        if table and table.game and user:
-            player = table.game.get_player_by_id(user.uuid)
+        game = table.game if table else None
+        if game and user:
+            player = game.get_player_by_id(user.uuid)
             if player:
-                table.game.handle_event(player, packet)
+                game.handle_event(player, packet)
                 # Check if player left the game (user replaced by bot or removed)
-                game_user = table.game._users.get(user.uuid)
+                game_user = game._users.get(user.uuid)
                 if game_user is not user:
                     table.remove_member(username)
                     self._show_main_menu(user)
@@ -2188,12 +2227,13 @@ class Server:
 
         user = self._users.get(username)
         table = self._tables.find_user_table(username)
-        if table and table.game and user:
-            player = table.game.get_player_by_id(user.uuid)
+        game = table.game if table else None
+        if game and user:
+            player = game.get_player_by_id(user.uuid)
             if player:
-                table.game.handle_event(player, packet)
+                game.handle_event(player, packet)
                 # Check if player left the game (user replaced by bot or removed)
-                game_user = table.game._users.get(user.uuid)
+                game_user = game._users.get(user.uuid)
                 if game_user is not user:
                     table.remove_member(username)
                     self._show_main_menu(user)
@@ -2213,52 +2253,26 @@ class Server:
             table = self._tables.find_user_table(username)
 
             if table:
-                for member_name in [m.username for m in table.members]:
-                    user = self._users.get(member_name)
-                    if user:
-                        await user.connection.send(
-                            {
-                                "type": "chat",
-                                "convo": "table",
-                                "sender": username,
-                                "message": message,
-                                "language": language,
-                            }
-                        )
+                payload = {
+                    "type": "chat",
+                    "convo": "table",
+                    "sender": username,
+                    "message": message,
+                    "language": language,
+                }
+                recipients = [
+                    user
+                    for member_name in table.members
+                    if (user := self._users.get(member_name))
+                ]
+                await self._send_chat(recipients, payload)
             else:
                 # Not in a table: treat as lobby chat
-                for other_username in self._users.keys():
-                    other_table = self._tables.find_user_table(other_username)
-                    if not other_table:
-                        user = self._users.get(other_username)
-                        if user:
-                            await user.connection.send(
-                                {
-                                    "type": "chat",
-                                    "convo": "game_lobby",
-                                    "sender": username,
-                                    "message": message,
-                                    "language": language,
-                                }
-                            )
+                await self._send_lobby_chat(username, message, language)
         elif convo == "game_lobby":
             # Game lobby chat: all users NOT in a table can chat
             # This is for anyone in menus/browsing, not in an actual game table
-            for other_username in self._users.keys():
-                # Check if user is NOT in a table
-                other_table = self._tables.find_user_table(other_username)
-                if not other_table:
-                    user = self._users.get(other_username)
-                    if user:
-                        await user.connection.send(
-                            {
-                                "type": "chat",
-                                "convo": "game_lobby",
-                                "sender": username,
-                                "message": message,
-                                "language": language,
-                            }
-                        )
+            await self._send_lobby_chat(username, message, language)
         elif convo == "global":
             # Broadcast to all users
             if self._ws_server:
@@ -2272,6 +2286,30 @@ class Server:
                     }
                 )
 
+    async def _send_lobby_chat(self, sender: str, message: str, language: str) -> None:
+        """Send a chat message to every user who is not at a table."""
+        payload = {
+            "type": "chat",
+            "convo": "game_lobby",
+            "sender": sender,
+            "message": message,
+            "language": language,
+        }
+        recipients = [
+            user
+            for other_username, user in self._users.items()
+            if not self._tables.find_user_table(other_username)
+        ]
+        await self._send_chat(recipients, payload)
+
+    async def _send_chat(self, recipients: list[NetworkUser], payload: dict) -> None:
+        """Send a chat packet to all recipients concurrently."""
+        frame = json.dumps(payload)
+        await asyncio.gather(
+            *(user.connection.send_raw(frame) for user in recipients),
+            return_exceptions=True,
+        )
+
     async def _handle_ping(self, client: ClientConnection) -> None:
         """Handle ping request - respond immediately with pong."""
         await client.send({"type": "pong"})
@@ -1,6 +1,8 @@
 """Tick scheduler for game updates."""
 
 import asyncio
+import time
+import traceback
 from typing import Callable
 
 
@@ -14,11 +16,16 @@ class TickScheduler:
 
     TICK_INTERVAL_MS = 50
     TICK_INTERVAL_S = TICK_INTERVAL_MS / 1000.0
+    ERROR_REPORT_INTERVAL_S = 10.0  # Min seconds between repeats of one error
 
     def __init__(self, on_tick: Callable[[], None]):
         self._on_tick = on_tick
         self._running = False
         self._task: asyncio.Task | None = None
+        # Tick error reporting state (to avoid flooding stdout every tick)
+        self._last_error: tuple[type, str] | None = None
+        self._last_error_time = 0.0
+        self._suppressed_errors = 0
 
     async def start(self) -> None:
         """Start the tick scheduler."""
@@ -37,12 +44,41 @@ class TickScheduler:
 
     async def _tick_loop(self) -> None:
         """Main tick loop."""
+        loop = asyncio.get_running_loop()
+        next_deadline = loop.time() + self.TICK_INTERVAL_S
         while self._running:
             try:
                 # Call tick callback synchronously
                 self._on_tick()
             except Exception as e:
-                print(f"Error in tick: {e}")
+                self._report_error(e)
 
-            # Sleep for tick interval
-            await asyncio.sleep(self.TICK_INTERVAL_S)
+            # Sleep until the next deadline so callback time doesn't add drift
+            now = loop.time()
+            delay = next_deadline - now
+            if delay < -self.TICK_INTERVAL_S:
+                # Fell more than a tick behind; resync rather than bursting
+                next_deadline = now
+                delay = 0
+            next_deadline += self.TICK_INTERVAL_S
+            # Always yield, even when late, so network I/O still gets to run
+            await asyncio.sleep(max(0.0, delay))
+
+    def _report_error(self, error: Exception) -> None:
+        """Print a tick error, rate limiting repeats of the same error."""
+        key = (type(error), str(error))
+        now = time.monotonic()
+        if (
+            key == self._last_error
+            and now - self._last_error_time < self.ERROR_REPORT_INTERVAL_S
+        ):
+            self._suppressed_errors += 1
+            return
+
+        if self._suppressed_errors:
+            print(f"Suppressed {self._suppressed_errors} repeated tick errors")
+        self._last_error = key
+        self._last_error_time = now
+        self._suppressed_errors = 0
+        print(f"Error in tick: {error}")
+        traceback.print_exc()
@@ -167,6 +167,9 @@ class ActionExecutionMixin:
                 if meta and isinstance(meta, MenuOption):
                     menu_option_meta = meta
 
+            # Option labels can come from a game method (options are IDs)
+            label_method = getattr(self, req.get_label, None) if req.get_label else None
+
             # Build menu items with localized labels if available
             items = []
             for opt in options:
@@ -174,6 +177,8 @@ class ActionExecutionMixin:
                     display_text = menu_option_meta.get_localized_choice(
                         opt, user.locale
                     )
+                elif label_method:
+                    display_text = label_method(player, opt)
                 else:
                     display_text = opt
                 items.append(MenuItem(text=display_text, id=opt))
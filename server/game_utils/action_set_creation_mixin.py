@@ -1,6 +1,6 @@
 """Mixin providing action set creation for games."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from ..games.base import Player
@@ -297,6 +297,17 @@ class ActionSetCreationMixin:
             self._keybinds[key] = []
         self._keybinds[key].append(keybind)
 
+    def define_keybinds(self, keybinds: Iterable[Keybind]) -> None:
+        """
+        Define several prebuilt keybinds at once.
+
+        Keybinds are never mutated after definition, so games may share
+        module-level Keybind instances.
+        """
+        table = self._keybinds
+        for keybind in keybinds:
+            table.setdefault(keybind.default_key, []).append(keybind)
+
     def _get_keybind_for_action(self, action_id: str) -> str | None:
         """Get the keybind string for an action, if any."""
         for key, keybinds in self._keybinds.items():
@@ -1,10 +1,9 @@
 """Action system for games - declarative callbacks for state management."""
 
-import copy
 import inspect
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
@@ -12,6 +11,20 @@ if TYPE_CHECKING:
     from ..games.base import Game, Player
 
 
+# Callback function -> whether it takes the optional action_id kwarg
+_accepts_action_id_cache: dict[object, bool] = {}
+
+
+def _accepts_action_id(method) -> bool:
+    """Check (once per function) whether a callback accepts action_id."""
+    func = getattr(method, "__func__", method)
+    accepts = _accepts_action_id_cache.get(func)
+    if accepts is None:
+        accepts = "action_id" in inspect.signature(method).parameters
+        _accepts_action_id_cache[func] = accepts
+    return accepts
+
+
 class Visibility(str, Enum):
     """Visibility state for actions."""
 
@@ -19,21 +32,26 @@ class Visibility(str, Enum):
     HIDDEN = "hidden"
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuInput(DataClassJSONMixin):
     """
     Request menu selection before action executes.
 
-    The options and bot_select are method names (strings) that will be
-    looked up on the game object at execution time.
+    The options, bot_select and get_label are method names (strings) that
+    will be looked up on the game object at execution time.
+
+    Options are the values passed back to the handler. When get_label is
+    set, it is called as (player, option) -> str for the text shown in the
+    menu, so options can be stable IDs instead of display strings.
     """
 
     prompt: str  # Localization key for menu title/prompt
     options: str  # Method name that returns list[str]
     bot_select: str | None = None  # Method name for bot auto-selection
+    get_label: str | None = None  # Optional method name for option display text
 
 
-@dataclass
+@dataclass(slots=True)
 class EditboxInput(DataClassJSONMixin):
     """
     Request text input before action executes.
@@ -47,7 +65,7 @@ class EditboxInput(DataClassJSONMixin):
     bot_input: str | None = None  # Method name for bot auto-input
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Action(DataClassJSONMixin):
     """
     A game action with declarative state callbacks.
@@ -92,7 +110,7 @@ class ResolvedAction:
     visible: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionSet(DataClassJSONMixin):
     """
     A named group of actions for a player.
@@ -111,6 +129,11 @@ class ActionSet(DataClassJSONMixin):
         if action.id not in self._order:
             self._order.append(action.id)
 
+    def add_many(self, actions: Iterable[Action]) -> None:
+        """Add several actions to this set, in order."""
+        for action in actions:
+            self.add(action)
+
     def remove(self, action_id: str) -> None:
         """Remove an action from this set."""
         if action_id in self._actions:
@@ -118,6 +141,13 @@ class ActionSet(DataClassJSONMixin):
         if action_id in self._order:
             self._order.remove(action_id)
 
+    def remove_many(self, action_ids: Iterable[str]) -> None:
+        """Remove several actions from this set with one pass over the order."""
+        action_ids = set(action_ids)
+        for action_id in action_ids:
+            self._actions.pop(action_id, None)
+        self._order = [a for a in self._order if a not in action_ids]
+
     def remove_by_prefix(self, prefix: str) -> None:
         """Remove all actions whose ID starts with the given prefix."""
         to_remove = [aid for aid in self._actions if aid.startswith(prefix)]
@@ -138,8 +168,7 @@ class ActionSet(DataClassJSONMixin):
             method = getattr(game, action.is_enabled, None)
             if method:
                 # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
+                if _accepts_action_id(method):
                     disabled_reason = method(player, action_id=action.id)
                 else:
                     disabled_reason = method(player)
@@ -150,8 +179,7 @@ class ActionSet(DataClassJSONMixin):
             method = getattr(game, action.is_hidden, None)
             if method:
                 # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
+                if _accepts_action_id(method):
                     visibility = method(player, action_id=action.id)
                 else:
                     visibility = method(player)
@@ -176,13 +204,13 @@ class ActionSet(DataClassJSONMixin):
         self, game: "Game", player: "Player"
     ) -> list[ResolvedAction]:
         """Resolve all actions' states for a player."""
+        actions = self._actions
+        resolve = self.resolve_action
         result = []
         for aid in self._order:
-            if aid not in self._actions:
-                continue
-            action = self._actions[aid]
-            resolved = self.resolve_action(game, player, action)
-            result.append(resolved)
+            action = actions.get(aid)
+            if action is not None:
+                result.append(resolve(game, player, action))
         return result
 
     def get_visible_actions(
@@ -209,4 +237,12 @@ class ActionSet(DataClassJSONMixin):
 
     def copy(self) -> "ActionSet":
         """Deep copy for templates."""
-        return copy.deepcopy(self)
+        # Actions only hold strings, so cloning each (and its input request)
+        # is a full deep copy without deepcopy's reflection overhead.
+        actions = {}
+        for aid, action in self._actions.items():
+            input_request = action.input_request
+            if input_request is not None:
+                input_request = replace(input_request)
+            actions[aid] = replace(action, input_request=input_request)
+        return ActionSet(name=self.name, _actions=actions, _order=list(self._order))
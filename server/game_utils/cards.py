@@ -4,7 +4,9 @@ Reusable card and deck utilities for card games.
 Provides Card, Deck, and DeckFactory classes that can be used by any card game.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
+import functools
 import random
 
 from mashumaro.mixins.json import DataClassJSONMixin
@@ -28,7 +30,7 @@ RS_RANK_SKIP = 18
 RS_RANK_NINETY_NINE = 19
 
 
-@dataclass
+@dataclass(slots=True)
 class Card(DataClassJSONMixin):
     """A playing card."""
 
@@ -49,22 +51,28 @@ class Card(DataClassJSONMixin):
 class Deck(DataClassJSONMixin):
     """A deck of cards with draw/shuffle operations."""
 
-    cards: list[Card] = field(default_factory=list)
+    cards: deque[Card] = field(default_factory=deque)
+
+    def __post_init__(self):
+        # Callers may hand in a plain list; keep draws from the top O(1)
+        if not isinstance(self.cards, deque):
+            self.cards = deque(self.cards)
 
     def shuffle(self) -> None:
         """Shuffle the deck in place."""
-        random.shuffle(self.cards)
+        cards = list(self.cards)
+        random.shuffle(cards)
+        self.cards = deque(cards)
 
     def draw(self, count: int = 1) -> list[Card]:
         """Draw cards from the top of the deck."""
-        drawn = self.cards[:count]
-        self.cards = self.cards[count:]
-        return drawn
+        popleft = self.cards.popleft
+        return [popleft() for _ in range(min(count, len(self.cards)))]
 
     def draw_one(self) -> Card | None:
         """Draw a single card from the top of the deck."""
         if self.cards:
-            return self.cards.pop(0)
+            return self.cards.popleft()
         return None
 
     def add(self, cards: list[Card]) -> None:
@@ -73,7 +81,7 @@ class Deck(DataClassJSONMixin):
 
     def add_top(self, cards: list[Card]) -> None:
         """Add cards to the top of the deck."""
-        self.cards = cards + self.cards
+        self.cards.extendleft(reversed(cards))
 
     def size(self) -> int:
         """Return the number of cards in the deck."""
@@ -85,16 +93,76 @@ class Deck(DataClassJSONMixin):
 
     def clear(self) -> list[Card]:
         """Remove and return all cards from the deck."""
-        cards = self.cards
-        self.cards = []
+        cards = list(self.cards)
+        self.cards.clear()
         return cards
 
 
+@functools.cache
+def _italian_cards(num_decks: int) -> tuple[Card, ...]:
+    """Build the shared Italian card template (ids in creation order)."""
+    cards = []
+    card_id = 0
+    for _ in range(num_decks):
+        for suit in range(1, 5):  # 1=diamonds, 2=clubs, 3=hearts, 4=spades
+            for rank in range(1, 11):  # 1-10
+                cards.append(Card(id=card_id, rank=rank, suit=suit))
+                card_id += 1
+    return tuple(cards)
+
+
+@functools.cache
+def _standard_cards(num_decks: int) -> tuple[Card, ...]:
+    """Build the shared standard card template (ids in creation order)."""
+    cards = []
+    card_id = 0
+    for _ in range(num_decks):
+        for suit in range(1, 5):  # 1=diamonds, 2=clubs, 3=hearts, 4=spades
+            for rank in range(1, 14):  # 1-13 (Ace through King)
+                cards.append(Card(id=card_id, rank=rank, suit=suit))
+                card_id += 1
+    return tuple(cards)
+
+
+@functools.cache
+def _rs_games_cards() -> tuple[Card, ...]:
+    """Build the shared RS Games card template (ids in creation order)."""
+    cards = []
+    card_id = 0
+
+    # Number cards 1-9 (4 of each = 36 cards)
+    for rank in range(1, 10):
+        for _ in range(4):
+            cards.append(Card(id=card_id, rank=rank, suit=SUIT_NONE))
+            card_id += 1
+
+    # Special cards (4 of each = 24 cards)
+    # 14=+10, 15=-10, 16=Pass, 17=Reverse, 18=Skip, 19=Ninety Nine
+    for rank in [
+        RS_RANK_PLUS_10,
+        RS_RANK_MINUS_10,
+        RS_RANK_PASS,
+        RS_RANK_REVERSE,
+        RS_RANK_SKIP,
+        RS_RANK_NINETY_NINE,
+    ]:
+        for _ in range(4):
+            cards.append(Card(id=card_id, rank=rank, suit=SUIT_NONE))
+            card_id += 1
+
+    return tuple(cards)
+
+
 class DeckFactory:
-    """Factory for creating common deck types."""
+    """
+    Factory for creating common deck types.
+
+    Card objects are built once per deck type and shared between decks
+    (cards are never mutated); each call returns a freshly shuffled Deck.
+    """
 
     @staticmethod
-    def italian_deck(num_decks: int = 1) -> tuple[Deck, dict[int, Card]]:
+    def italian_deck(num_decks: int = 1) -> tuple[Deck, tuple[Card, ...]]:
         """
         Create Italian 40-card deck (4 suits x 10 ranks).
 
@@ -102,24 +170,15 @@ class DeckFactory:
             num_decks: Number of decks to combine.
 
         Returns:
-            Tuple of (shuffled deck, card lookup dict mapping id -> Card)
+            Tuple of (shuffled deck, card lookup indexed by card id)
         """
-        cards = []
-        card_lookup: dict[int, Card] = {}
-        card_id = 0
-        for _ in range(num_decks):
-            for suit in range(1, 5):  # 1=diamonds, 2=clubs, 3=hearts, 4=spades
-                for rank in range(1, 11):  # 1-10
-                    card = Card(id=card_id, rank=rank, suit=suit)
-                    cards.append(card)
-                    card_lookup[card_id] = card
-                    card_id += 1
-        deck = Deck(cards=cards)
+        cards = _italian_cards(num_decks)
+        deck = Deck(cards=deque(cards))
         deck.shuffle()
-        return deck, card_lookup
+        return deck, cards
 
     @staticmethod
-    def standard_deck(num_decks: int = 1) -> tuple[Deck, dict[int, Card]]:
+    def standard_deck(num_decks: int = 1) -> tuple[Deck, tuple[Card, ...]]:
         """
         Create standard 52-card deck (4 suits x 13 ranks).
 
@@ -127,24 +186,15 @@ class DeckFactory:
             num_decks: Number of decks to combine.
 
         Returns:
-            Tuple of (shuffled deck, card lookup dict mapping id -> Card)
+            Tuple of (shuffled deck, card lookup indexed by card id)
         """
-        cards = []
-        card_lookup: dict[int, Card] = {}
-        card_id = 0
-        for _ in range(num_decks):
-            for suit in range(1, 5):  # 1=diamonds, 2=clubs, 3=hearts, 4=spades
-                for rank in range(1, 14):  # 1-13 (Ace through King)
-                    card = Card(id=card_id, rank=rank, suit=suit)
-                    cards.append(card)
-                    card_lookup[card_id] = card
-                    card_id += 1
-        deck = Deck(cards=cards)
+        cards = _standard_cards(num_decks)
+        deck = Deck(cards=deque(cards))
         deck.shuffle()
-        return deck, card_lookup
+        return deck, cards
 
     @staticmethod
-    def rs_games_deck() -> tuple[Deck, dict[int, Card]]:
+    def rs_games_deck() -> tuple[Deck, tuple[Card, ...]]:
         """
         Create RS Games 60-card deck for Ninety-Nine variant.
 
@@ -153,39 +203,12 @@ class DeckFactory:
         - Special cards: +10, -10, Pass, Reverse, Skip, Ninety-Nine (4 of each, 24 cards)
 
         Returns:
-            Tuple of (shuffled deck, card lookup dict mapping id -> Card)
+            Tuple of (shuffled deck, card lookup indexed by card id)
         """
-        cards = []
-        card_lookup: dict[int, Card] = {}
-        card_id = 0
-
-        # Number cards 1-9 (4 of each = 36 cards)
-        for rank in range(1, 10):
-            for _ in range(4):
-                card = Card(id=card_id, rank=rank, suit=SUIT_NONE)
-                cards.append(card)
-                card_lookup[card_id] = card
-                card_id += 1
-
-        # Special cards (4 of each = 24 cards)
-        # 14=+10, 15=-10, 16=Pass, 17=Reverse, 18=Skip, 19=Ninety Nine
-        for rank in [
-            RS_RANK_PLUS_10,
-            RS_RANK_MINUS_10,
-            RS_RANK_PASS,
-            RS_RANK_REVERSE,
-            RS_RANK_SKIP,
-            RS_RANK_NINETY_NINE,
-        ]:
-            for _ in range(4):
-                card = Card(id=card_id, rank=rank, suit=SUIT_NONE)
-                cards.append(card)
-                card_lookup[card_id] = card
-                card_id += 1
-
-        deck = Deck(cards=cards)
+        cards = _rs_games_cards()
+        deck = Deck(cards=deque(cards))
         deck.shuffle()
-        return deck, card_lookup
+        return deck, cards
 
 
 # Suit localization keys
@@ -232,6 +255,13 @@ RS_GAMES_RANK_NAMES = {
     RS_RANK_NINETY_NINE: "Ninety Nine",
 }
 
+# Localized card names, keyed by (rank, suit, locale)
+_card_name_cache: dict[tuple[int, int, str], str] = {}
+
+# Short card name characters
+SHORT_SUIT_CHARS = {1: "D", 2: "C", 3: "H", 4: "S"}
+SHORT_RANK_CHARS = {1: "A", 11: "J", 12: "Q", 13: "K"}
+
 
 def card_name(card: Card, locale: str = "en") -> str:
     """
@@ -250,13 +280,20 @@ def card_name(card: Card, locale: str = "en") -> str:
     if card.suit == SUIT_NONE:
         return RS_GAMES_RANK_NAMES.get(card.rank, str(card.rank))
 
+    key = (card.rank, card.suit, locale)
+    name = _card_name_cache.get(key)
+    if name is not None:
+        return name
+
     rank_key = RANK_KEYS.get(card.rank)
     suit_key = SUIT_KEYS.get(card.suit)
 
     rank_name = Localization.get(locale, rank_key) if rank_key else str(card.rank)
     suit_name = Localization.get(locale, suit_key) if suit_key else str(card.suit)
 
-    return Localization.get(locale, "card-name", rank=rank_name, suit=suit_name)
+    name = Localization.get(locale, "card-name", rank=rank_name, suit=suit_name)
+    _card_name_cache[key] = name
+    return name
 
 
 def card_name_with_article(card: Card, locale: str = "en") -> str:
@@ -291,10 +328,8 @@ def card_name_short(card: Card) -> str:
     if card.suit == SUIT_NONE:
         return RS_GAMES_RANK_NAMES.get(card.rank, str(card.rank))
 
-    suit_chars = {1: "D", 2: "C", 3: "H", 4: "S"}
-    rank_chars = {1: "A", 11: "J", 12: "Q", 13: "K"}
-    rank_str = rank_chars.get(card.rank, str(card.rank))
-    suit_str = suit_chars.get(card.suit, "?")
+    rank_str = SHORT_RANK_CHARS.get(card.rank, str(card.rank))
+    suit_str = SHORT_SUIT_CHARS.get(card.suit, "?")
     return f"{rank_str}{suit_str}"
 
 
@@ -326,7 +361,9 @@ def sort_cards(cards: list[Card], by_suit: bool = True) -> list[Card]:
     Returns:
         New sorted list of cards.
     """
+    # Ranks and suits are both below 32, so a packed int orders the same as
+    # the (major, minor) tuple without allocating one per card
     if by_suit:
-        return sorted(cards, key=lambda c: (c.suit, c.rank))
+        return sorted(cards, key=lambda c: (c.suit << 5) | c.rank)
     else:
-        return sorted(cards, key=lambda c: (c.rank, c.suit))
+        return sorted(cards, key=lambda c: (c.rank << 5) | c.suit)
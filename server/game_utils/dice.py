@@ -139,21 +139,22 @@ class DiceSet(DataClassJSONMixin):
             self.kept.remove(index)
         return True
 
-    def toggle_keep(self, index: int) -> bool | None:
+    def toggle_keep(self, index: int) -> tuple[bool, int | None] | None:
         """
         Toggle keep status of a die.
 
         Returns:
-            True if now kept, False if now unkept, None if locked.
+            (kept_now, die_value), or None if the die is locked.
         """
         if index in self.locked:
             return None
         if index in self.kept:
             self.kept.remove(index)
-            return False
+            kept_now = False
         else:
             self.kept.append(index)
-            return True
+            kept_now = True
+        return kept_now, self.get_value(index)
 
     def get_value(self, index: int) -> int | None:
         """Get the value of a specific die."""
@@ -161,6 +162,34 @@ class DiceSet(DataClassJSONMixin):
             return None
         return self.values[index]
 
+    def keep_first_by_value(self, value: int) -> int | None:
+        """
+        Keep the first unkept, unlocked die showing value.
+
+        Returns:
+            Index of the die now kept, or None if there was no such die.
+        """
+        kept, locked = self.kept, self.locked
+        for i, v in enumerate(self.values):
+            if v == value and i not in kept and i not in locked:
+                kept.append(i)
+                return i
+        return None
+
+    def unkeep_first_by_value(self, value: int) -> int | None:
+        """
+        Unkeep the first kept (but not locked) die showing value.
+
+        Returns:
+            Index of the die now unkept, or None if there was no such die.
+        """
+        kept, locked = self.kept, self.locked
+        for i, v in enumerate(self.values):
+            if v == value and i in kept and i not in locked:
+                kept.remove(i)
+                return i
+        return None
+
     def get_status(self, index: int) -> str:
         """Get status string for a die: 'locked', 'kept', or ''."""
         if index in self.locked:
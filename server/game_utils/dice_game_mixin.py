@@ -10,13 +10,89 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .actions import Action, ActionSet, Visibility
-from ..ui.keybinds import KeybindState
+from ..ui.keybinds import Keybind, KeybindState
 from ..users.preferences import DiceKeepingStyle
 
 if TYPE_CHECKING:
     from ..games.base import Player
 
 
+# Toggle labels per face value as (plain, kept, locked); index 0 unused
+_DIE_LABELS = tuple((str(v), f"{v} (kept)", f"{v} (locked)") for v in range(7))
+
+
+# Actions are immutable, so every action set shares these instances
+_TOGGLE_DIE_ACTIONS = tuple(
+    Action(
+        id=f"toggle_die_{i}",
+        label=f"Die {i + 1}",
+        handler="_action_toggle_die",
+        is_enabled="_is_toggle_die_enabled",
+        is_hidden="_is_toggle_die_hidden",
+        get_label="_get_toggle_die_label",
+    )
+    for i in range(6)
+)
+
+# Keybind-only actions for keys 1-6 and shift+1-6 (Quentin C unkeeping).
+# These are hidden but enabled - they're only triggered via keybinds.
+_DICE_KEY_ACTIONS = tuple(
+    action
+    for v in range(1, 7)
+    for action in (
+        Action(
+            id=f"dice_key_{v}",
+            label=f"Dice key {v}",
+            handler="_action_dice_key",
+            is_enabled="_is_dice_key_enabled",
+            is_hidden="_is_dice_key_hidden",
+        ),
+        Action(
+            id=f"dice_unkeep_{v}",
+            label=f"Unkeep {v}",
+            handler="_action_dice_unkeep",
+            is_enabled="_is_dice_key_enabled",
+            is_hidden="_is_dice_key_hidden",
+        ),
+    )
+)
+
+
+# Keys 1-6 keep/toggle (style determines behavior); shift+1-6 unkeep
+# (Quentin C style)
+_DICE_KEYBINDS = tuple(
+    keybind
+    for v in range(1, 7)
+    for keybind in (
+        Keybind(
+            name=f"Dice key {v}",
+            default_key=str(v),
+            actions=[f"dice_key_{v}"],
+            state=KeybindState.ACTIVE,
+        ),
+        Keybind(
+            name=f"Unkeep dice {v}",
+            default_key=f"shift+{v}",
+            actions=[f"dice_unkeep_{v}"],
+            state=KeybindState.ACTIVE,
+        ),
+    )
+)
+
+
+def die_toggle_label(value: int, locked: bool, kept: bool) -> str:
+    """Label for a die toggle action showing value and keep/lock status."""
+    if value < len(_DIE_LABELS):
+        labels = _DIE_LABELS[value]
+    else:
+        labels = (str(value), f"{value} (kept)", f"{value} (locked)")
+    if locked:
+        return labels[2]
+    if kept:
+        return labels[1]
+    return labels[0]
+
+
 class DiceGameMixin:
     """
     Mixin providing dice toggle actions for games using DiceSet.
@@ -61,40 +137,9 @@ class DiceGameMixin:
             num_dice: Number of dice (default 5).
         """
         # Menu item actions - always toggle by index
-        for i in range(num_dice):
-            action_set.add(
-                Action(
-                    id=f"toggle_die_{i}",
-                    label=f"Die {i + 1}",
-                    handler="_action_toggle_die",
-                    is_enabled=f"_is_toggle_die_{i}_enabled",
-                    is_hidden=f"_is_toggle_die_{i}_hidden",
-                    get_label=f"_get_toggle_die_{i}_label",
-                )
-            )
-
+        action_set.add_many(_TOGGLE_DIE_ACTIONS[:num_dice])
         # Keybind actions for keys 1-6 (respects user preference)
-        # These are hidden but enabled - they're only triggered via keybinds
-        for v in range(1, 7):
-            action_set.add(
-                Action(
-                    id=f"dice_key_{v}",
-                    label=f"Dice key {v}",
-                    handler="_action_dice_key",
-                    is_enabled="_is_dice_key_enabled",
-                    is_hidden="_is_dice_key_hidden",
-                )
-            )
-            # Shift+key actions for Quentin C style unkeeping
-            action_set.add(
-                Action(
-                    id=f"dice_unkeep_{v}",
-                    label=f"Unkeep {v}",
-                    handler="_action_dice_unkeep",
-                    is_enabled="_is_dice_key_enabled",
-                    is_hidden="_is_dice_key_hidden",
-                )
-            )
+        action_set.add_many(_DICE_KEY_ACTIONS)
 
     def setup_dice_keybinds(self, num_dice: int = 5) -> None:
         """
@@ -107,21 +152,7 @@ class DiceGameMixin:
         Args:
             num_dice: Number of dice (default 5).
         """
-        # Keys 1-6 for keeping/toggling
-        for v in range(1, 7):
-            self.define_keybind(
-                str(v),
-                f"Dice key {v}",
-                [f"dice_key_{v}"],
-                state=KeybindState.ACTIVE,
-            )
-            # Shift+1-6 for unkeeping (Quentin C style)
-            self.define_keybind(
-                f"shift+{v}",
-                f"Unkeep dice {v}",
-                [f"dice_unkeep_{v}"],
-                state=KeybindState.ACTIVE,
-            )
+        self.define_keybinds(_DICE_KEYBINDS)
 
     # ==========================================================================
     # Default is_enabled / is_hidden implementations (games can override)
@@ -137,79 +168,19 @@ class DiceGameMixin:
         """Dice keybind actions are always hidden (keybind only)."""
         return Visibility.HIDDEN
 
-    # Per-die enabled/hidden/label methods - delegate to generic versions
+    # Toggle enabled/hidden/label callbacks - shared by every die
     # These use action_id to extract die index, so they work for any number of dice
     # Games must implement _is_dice_toggle_enabled, _is_dice_toggle_hidden, _get_dice_toggle_label
 
-    def _is_toggle_die_0_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 0
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_1_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 1
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_2_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 2
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_3_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 3
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_4_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 4
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_5_enabled(self, player: Player, *, action_id: str = None) -> str | None:
-        die_index = int(action_id.split("_")[-1]) if action_id else 5
-        return self._is_dice_toggle_enabled(player, die_index)
-
-    def _is_toggle_die_0_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 0
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _is_toggle_die_1_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 1
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _is_toggle_die_2_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 2
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _is_toggle_die_3_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 3
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _is_toggle_die_4_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 4
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _is_toggle_die_5_hidden(self, player: Player, *, action_id: str = None) -> Visibility:
-        die_index = int(action_id.split("_")[-1]) if action_id else 5
-        return self._is_dice_toggle_hidden(player, die_index)
-
-    def _get_toggle_die_0_label(self, player: Player, action_id: str) -> str:
+    def _is_toggle_die_enabled(self, player: Player, *, action_id: str) -> str | None:
         die_index = int(action_id.split("_")[-1])
-        return self._get_dice_toggle_label(player, die_index)
-
-    def _get_toggle_die_1_label(self, player: Player, action_id: str) -> str:
-        die_index = int(action_id.split("_")[-1])
-        return self._get_dice_toggle_label(player, die_index)
-
-    def _get_toggle_die_2_label(self, player: Player, action_id: str) -> str:
-        die_index = int(action_id.split("_")[-1])
-        return self._get_dice_toggle_label(player, die_index)
-
-    def _get_toggle_die_3_label(self, player: Player, action_id: str) -> str:
-        die_index = int(action_id.split("_")[-1])
-        return self._get_dice_toggle_label(player, die_index)
+        return self._is_dice_toggle_enabled(player, die_index)
 
-    def _get_toggle_die_4_label(self, player: Player, action_id: str) -> str:
+    def _is_toggle_die_hidden(self, player: Player, *, action_id: str) -> Visibility:
         die_index = int(action_id.split("_")[-1])
-        return self._get_dice_toggle_label(player, die_index)
+        return self._is_dice_toggle_hidden(player, die_index)
 
-    def _get_toggle_die_5_label(self, player: Player, action_id: str) -> str:
+    def _get_toggle_die_label(self, player: Player, action_id: str) -> str:
         die_index = int(action_id.split("_")[-1])
         return self._get_dice_toggle_label(player, die_index)
 
@@ -220,11 +191,12 @@ class DiceGameMixin:
             return "action-not-playing"
         if self.current_player != player:
             return "action-not-your-turn"
-        if not hasattr(player, "dice"):
+        dice = getattr(player, "dice", None)
+        if dice is None:
             return "dice-no-dice"
-        if not player.dice.has_rolled:
+        if not dice.has_rolled:
             return "dice-not-rolled"
-        if player.dice.is_locked(die_index):
+        if dice.is_locked(die_index):
             return "dice-locked"
         return None
 
@@ -234,24 +206,20 @@ class DiceGameMixin:
             return Visibility.HIDDEN
         if self.current_player != player:
             return Visibility.HIDDEN
-        if not hasattr(player, "dice"):
-            return Visibility.HIDDEN
-        if not player.dice.has_rolled:
+        dice = getattr(player, "dice", None)
+        if dice is None or not dice.has_rolled:
             return Visibility.HIDDEN
         return Visibility.VISIBLE
 
     def _get_dice_toggle_label(self, player: Player, die_index: int) -> str:
         """Get label for die toggle action. Override in game class."""
-        if not hasattr(player, "dice"):
-            return f"Die {die_index + 1}"
-        die_val = player.dice.get_value(die_index)
+        dice = getattr(player, "dice", None)
+        die_val = dice.get_value(die_index) if dice is not None else None
         if die_val is None:
             return f"Die {die_index + 1}"
-        if player.dice.is_locked(die_index):
-            return f"{die_val} (locked)"
-        if player.dice.is_kept(die_index):
-            return f"{die_val} (kept)"
-        return str(die_val)
+        return die_toggle_label(
+            die_val, dice.is_locked(die_index), dice.is_kept(die_index)
+        )
 
     # Single toggle handler for all dice (extracts index from action ID)
     def _action_toggle_die(self, player: Player, action_id: str) -> None:
@@ -274,6 +242,13 @@ class DiceGameMixin:
         value = int(action_id.split("_")[-1])
         self._handle_dice_unkeep(player, value)
 
+    def _get_dice_keeping_style(self, player: Player) -> DiceKeepingStyle | None:
+        """Get the player's dice keeping style, or None if no user is attached."""
+        user = self.get_user(player)
+        if not user:
+            return None
+        return user.preferences.dice_keeping_style
+
     def _handle_dice_key(self, player: Player, key_num: int) -> None:
         """
         Handle a dice key press (1-6).
@@ -282,16 +257,15 @@ class DiceGameMixin:
         - PlayPalace style: Toggle die at index (key_num - 1)
         - Quentin C style: Keep first unkept die with face value key_num
         """
-        user = self.get_user(player)
-        if not user:
+        style = self._get_dice_keeping_style(player)
+        if style is None:
             return
 
-        style = user.preferences.dice_keeping_style
-
         if style == DiceKeepingStyle.PLAYPALACE:
             # Toggle by index - check if die index is valid
             die_index = key_num - 1
-            if hasattr(player, "dice") and die_index < player.dice.num_dice:
+            dice = getattr(player, "dice", None)
+            if dice is not None and die_index < dice.num_dice:
                 self._toggle_die(player, die_index)
         else:
             # Quentin C style: keep by face value
@@ -303,13 +277,7 @@ class DiceGameMixin:
 
         Only works in Quentin C style. Silent in PlayPalace style.
         """
-        user = self.get_user(player)
-        if not user:
-            return
-
-        style = user.preferences.dice_keeping_style
-
-        if style == DiceKeepingStyle.QUENTIN_C:
+        if self._get_dice_keeping_style(player) == DiceKeepingStyle.QUENTIN_C:
             self._unkeep_by_value(player, value)
         # Silent in PlayPalace style
 
@@ -320,20 +288,21 @@ class DiceGameMixin:
         Handles the common logic for toggling dice in games using DiceSet.
         Speaks the appropriate message (keeping/rerolling/locked).
         """
-        if not hasattr(player, "dice"):
+        dice = getattr(player, "dice", None)
+        if dice is None:
             return
 
         user = self.get_user(player)
-        result = player.dice.toggle_keep(die_index)
+        outcome = dice.toggle_keep(die_index)
 
-        if result is None:
+        if outcome is None:
             # Die is locked
             if user:
                 user.speak_l("dice-locked")
             return
 
-        die_val = player.dice.get_value(die_index)
-        if result:
+        kept_now, die_val = outcome
+        if kept_now:
             # Now kept
             if user:
                 user.speak_l("dice-keeping", value=die_val)
@@ -350,23 +319,17 @@ class DiceGameMixin:
 
         Used in Quentin C style. Silent if no unkept die with that value exists.
         """
-        if not hasattr(player, "dice"):
+        dice = getattr(player, "dice", None)
+        if dice is None:
             return
 
-        user = self.get_user(player)
-        dice = player.dice
+        if dice.keep_first_by_value(value) is None:
+            return  # No matching die found - silent
 
-        # Find first unkept, unlocked die with this value
-        for i in range(dice.num_dice):
-            if not dice.is_locked(i) and not dice.is_kept(i):
-                if dice.get_value(i) == value:
-                    dice.keep(i)
-                    if user:
-                        user.speak_l("dice-keeping", value=value)
-                    self.rebuild_player_menu(player)
-                    return
-
-        # No matching die found - silent
+        user = self.get_user(player)
+        if user:
+            user.speak_l("dice-keeping", value=value)
+        self.rebuild_player_menu(player)
 
     def _unkeep_by_value(self, player: Player, value: int) -> None:
         """
@@ -374,20 +337,23 @@ class DiceGameMixin:
 
         Used in Quentin C style. Silent if no kept die with that value exists.
         """
-        if not hasattr(player, "dice"):
+        dice = getattr(player, "dice", None)
+        if dice is None:
             return
 
+        if dice.unkeep_first_by_value(value) is None:
+            return  # No matching die found - silent
+
         user = self.get_user(player)
-        dice = player.dice
-
-        # Find first kept (but not locked) die with this value
-        for i in range(dice.num_dice):
-            if dice.is_kept(i) and not dice.is_locked(i):
-                if dice.get_value(i) == value:
-                    dice.unkeep(i)
-                    if user:
-                        user.speak_l("dice-rerolling", value=value)
-                    self.rebuild_player_menu(player)
-                    return
-
-        # No matching die found - silent
+        if user:
+            user.speak_l("dice-rerolling", value=value)
+        self.rebuild_player_menu(player)
+
+
+# Action sets saved before the shared toggle callbacks reference per-die
+# method names; alias them so restored games keep resolving.
+for _i in range(6):
+    setattr(DiceGameMixin, f"_is_toggle_die_{_i}_enabled", DiceGameMixin._is_toggle_die_enabled)
+    setattr(DiceGameMixin, f"_is_toggle_die_{_i}_hidden", DiceGameMixin._is_toggle_die_hidden)
+    setattr(DiceGameMixin, f"_get_toggle_die_{_i}_label", DiceGameMixin._get_toggle_die_label)
+del _i
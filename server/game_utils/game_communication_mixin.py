@@ -36,12 +36,18 @@ class GameCommunicationMixin:
         **kwargs,
     ) -> None:
         """Send a localized message to all players (each in their own locale)."""
+        # Format once per locale; players sharing a locale get the same text
+        texts: dict[str, str] = {}
         for player in self.players:
             if player is exclude:
                 continue
             user = self.get_user(player)
             if user:
-                user.speak_l(message_id, buffer, **kwargs)
+                text = texts.get(user.locale)
+                if text is None:
+                    text = Localization.get(user.locale, message_id, **kwargs)
+                    texts[user.locale] = text
+                user.speak(text, buffer)
 
     def broadcast_personal_l(
         self,
@@ -68,12 +74,19 @@ class GameCommunicationMixin:
         if user:
             user.speak_l(personal_message_id, buffer, **kwargs)
 
+        texts: dict[str, str] = {}
         for p in self.players:
             if p is player:
                 continue
             u = self.get_user(p)
             if u:
-                u.speak_l(others_message_id, buffer, player=player.name, **kwargs)
+                text = texts.get(u.locale)
+                if text is None:
+                    text = Localization.get(
+                        u.locale, others_message_id, player=player.name, **kwargs
+                    )
+                    texts[u.locale] = text
+                u.speak(text, buffer)
 
     def label_l(self, message_id: str) -> Callable[["Game", "Player"], str]:
         """
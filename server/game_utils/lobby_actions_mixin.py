@@ -107,6 +107,7 @@ class LobbyActionsMixin:
         for i in range(len(self.players) - 1, -1, -1):
             if self.players[i].is_bot:
                 bot = self.players.pop(i)
+                self.invalidate_player_index()
                 # Clean up action sets
                 self.player_action_sets.pop(bot.id, None)
                 self._users.pop(bot.id, None)
@@ -156,6 +157,7 @@ class LobbyActionsMixin:
 
         # Lobby or bot leaving: fully remove the player
         self.players = [p for p in self.players if p.id != player.id]
+        self.invalidate_player_index()
         self.player_action_sets.pop(player.id, None)
         self._users.pop(player.id, None)
 
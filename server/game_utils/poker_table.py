@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class PokerTableState(DataClassJSONMixin):
     """Tracks dealer/button and blind positions."""
     button_index: int = 0
@@ -18,11 +19,13 @@ class PokerTableState(DataClassJSONMixin):
             return
         # Remap button to current active list before advancing
         if self.button_player_id and self.button_player_id in active_ids:
-            self.button_index = active_ids.index(self.button_player_id)
+            index = active_ids.index(self.button_player_id) + 1
         else:
-            self.button_index = 0
-        self.button_index = (self.button_index + 1) % len(active_ids)
-        self.button_player_id = active_ids[self.button_index]
+            index = 1
+        if index == len(active_ids):
+            index = 0
+        self.button_index = index
+        self.button_player_id = active_ids[index]
 
     def get_button_id(self, active_ids: list[str]) -> str | None:
         if not active_ids:
@@ -34,10 +37,17 @@ class PokerTableState(DataClassJSONMixin):
     def get_blind_indices(self, active_ids: list[str]) -> tuple[int, int]:
         if not active_ids:
             return (0, 0)
-        if len(active_ids) == 2:
-            sb = self.button_index % 2
-            bb = (sb + 1) % 2
-            return (sb, bb)
-        sb = (self.button_index + 1) % len(active_ids)
-        bb = (sb + 1) % len(active_ids)
-        return (sb, bb)
+        return _blind_indices(self.button_index, len(active_ids))
+
+
+@lru_cache(maxsize=64)
+def _blind_indices(button_index: int, num_active: int) -> tuple[int, int]:
+    """Small/big blind seat indices; depends only on button and seat count."""
+    if num_active == 2:
+        sb = button_index % 2
+        return (sb, 1 - sb)
+    sb = (button_index + 1) % num_active
+    bb = sb + 1
+    if bb == num_active:
+        bb = 0
+    return (sb, bb)
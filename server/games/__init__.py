@@ -1,32 +1,36 @@
 """Game implementations."""
 
+import importlib
+
 from .base import Game
-from .registry import GameRegistry, register_game, get_game_class
+from .registry import (
+    GAME_MODULES,
+    GameRegistry,
+    register_game,
+    get_game_class,
+    load_all_games,
+)
+
+# Game modules are imported lazily (see registry.GAME_MODULES); the class
+# names below still resolve as attributes of this package.
+_LAZY_CLASSES = {
+    class_name: module_name for module_name, class_name in GAME_MODULES.values()
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
 
-# Import all games to trigger registration
-from .pig.game import PigGame
-from .scopa.game import ScopaGame
-from .lightturret.game import LightTurretGame
-from .threes.game import ThreesGame
-from .milebymile.game import MileByMileGame
-from .chaosbear.game import ChaosBearGame
-from .farkle.game import FarkleGame
-from .yahtzee.game import YahtzeeGame
-from .ninetynine.game import NinetyNineGame
-from .tradeoff.game import TradeoffGame
-from .pirates.game import PiratesGame
-from .leftrightcenter.game import LeftRightCenterGame
-from .tossup.game import TossUpGame
-from .midnight.game import MidnightGame
-from .ageofheroes.game import AgeOfHeroesGame
-from .fivecarddraw.game import FiveCardDrawGame
-from .holdem.game import HoldemGame
 
 __all__ = [
     "Game",
     "GameRegistry",
     "register_game",
     "get_game_class",
+    "load_all_games",
     "PigGame",
     "ScopaGame",
     "LightTurretGame",
@@ -8,6 +8,11 @@ import threading
 from mashumaro.mixins.json import DataClassJSONMixin
 from mashumaro.config import BaseConfig
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
 from ..users.base import User
 from ..game_utils.actions import ActionSet
 from ..game_utils.options import (
@@ -156,6 +161,9 @@ class Game(
         self._estimate_errors: list[str] = []  # Collected errors
         self._estimate_running: bool = False  # Whether estimation is in progress
         self._estimate_lock: threading.Lock = threading.Lock()  # Protect results list
+        # Player lookup indexes, rebuilt lazily from self.players
+        self._players_by_id: dict[str, Player] | None = None
+        self._players_by_name: dict[str, Player] | None = None
 
     def rebuild_runtime_state(self) -> None:
         """
@@ -170,6 +178,22 @@ class Game(
         """
         pass
 
+    def to_json(self, **kwargs) -> str:
+        """Serialize game state to JSON, using orjson when installed."""
+        if orjson is None:
+            return super().to_json(**kwargs)
+        # Non-str keys match stdlib json, which stringifies int dict keys
+        return orjson.dumps(
+            self.to_dict(**kwargs), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    @classmethod
+    def from_json(cls, data: str | bytes, **kwargs):
+        """Deserialize game state from JSON, using orjson when installed."""
+        if orjson is None:
+            return super().from_json(data, **kwargs)
+        return cls.from_dict(orjson.loads(data), **kwargs)
+
     # Abstract methods games must implement
 
     @classmethod
@@ -296,19 +320,35 @@ class Game(
         """Get the user for a player."""
         return self._users.get(player.id)
 
+    def invalidate_player_index(self) -> None:
+        """Drop the player lookup indexes. Call after removing players."""
+        self._players_by_id = None
+        self._players_by_name = None
+
+    def _rebuild_player_index(self) -> None:
+        """Index players by ID and name (first match wins, like a scan)."""
+        players = self.players[::-1]
+        self._players_by_id = {p.id: p for p in players}
+        self._players_by_name = {p.name: p for p in players}
+
     def get_player_by_id(self, player_id: str) -> Player | None:
         """Get a player by ID (UUID)."""
-        for player in self.players:
-            if player.id == player_id:
+        if self._players_by_id is not None:
+            player = self._players_by_id.get(player_id)
+            if player is not None:
                 return player
-        return None
+        # Unindexed, or a player may have been appended since the last build
+        self._rebuild_player_index()
+        return self._players_by_id.get(player_id)
 
     def get_player_by_name(self, name: str) -> Player | None:
         """Get a player by display name. Note: Names may not be unique."""
-        for player in self.players:
-            if player.name == name:
+        if self._players_by_name is not None:
+            player = self._players_by_name.get(name)
+            if player is not None:
                 return player
-        return None
+        self._rebuild_player_index()
+        return self._players_by_name.get(name)
 
     @property
     def team_manager(self) -> TeamManager:
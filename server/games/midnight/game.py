@@ -14,7 +14,7 @@ from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
 from ...game_utils.dice import DiceSet
-from ...game_utils.dice_game_mixin import DiceGameMixin
+from ...game_utils.dice_game_mixin import DiceGameMixin, die_toggle_label
 from ...game_utils.game_result import GameResult, PlayerResult
 from ...game_utils.options import IntOption, option_field
 from ...messages.localization import Localization
@@ -143,11 +143,11 @@ class MidnightGame(Game, DiceGameMixin):
             return f"Die {die_index + 1}"
 
         die_val = midnight_player.dice.values[die_index]
-        if midnight_player.dice.is_locked(die_index):
-            return f"{die_val} (locked)"
-        if midnight_player.dice.is_kept(die_index):
-            return f"{die_val} (kept)"
-        return str(die_val)
+        return die_toggle_label(
+            die_val,
+            midnight_player.dice.is_locked(die_index),
+            midnight_player.dice.is_kept(die_index),
+        )
 
     # Dice toggle handlers provided by DiceGameMixin (no override needed)
 
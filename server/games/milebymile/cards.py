@@ -1,5 +1,6 @@
 """Card definitions and deck management for Mile by Mile."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 import random
@@ -55,6 +56,11 @@ HAZARD_TO_REMEDY: dict[str, str] = {
     HazardType.STOP: RemedyType.ROLL,
 }
 
+# Mapping: remedy -> hazard it fixes
+REMEDY_TO_HAZARD: dict[str, str] = {
+    remedy: hazard for hazard, remedy in HAZARD_TO_REMEDY.items()
+}
+
 # Mapping: hazard -> safety that blocks it
 HAZARD_TO_SAFETY: dict[str, str] = {
     HazardType.OUT_OF_GAS: SafetyType.EXTRA_TANK,
@@ -102,7 +108,7 @@ class Card(DataClassJSONMixin):
 
     id: int  # Unique ID for this card instance
     card_type: str  # CardType value
-    value: str  # Distance value or hazard/remedy/safety type
+    value: str  # Distance value or hazard/remedy/safety type (unique per kind of card)
 
     @property
     def name(self) -> str:
@@ -123,9 +129,14 @@ class Card(DataClassJSONMixin):
 class Deck(DataClassJSONMixin):
     """A deck of cards with draw and shuffle functionality."""
 
-    cards: list[Card] = field(default_factory=list)
+    cards: deque[Card] = field(default_factory=deque)
     _next_id: int = 0
 
+    def __post_init__(self):
+        # Keep draws from the top O(1), including for decks loaded from JSON
+        if not isinstance(self.cards, deque):
+            self.cards = deque(self.cards)
+
     def _create_card(self, card_type: str, value: str) -> Card:
         """Create a card with a unique ID."""
         card = Card(id=self._next_id, card_type=card_type, value=value)
@@ -139,7 +150,7 @@ class Deck(DataClassJSONMixin):
         include_karma_cards: bool = False,
     ) -> None:
         """Build a standard Mile by Mile deck."""
-        self.cards = []
+        self.cards = deque()
 
         # Distance cards (46 total)
         for _ in range(10):
@@ -194,22 +205,26 @@ class Deck(DataClassJSONMixin):
 
     def shuffle(self) -> None:
         """Shuffle the deck using Fisher-Yates."""
-        random.shuffle(self.cards)
+        # Shuffle a list copy: deque indexing is O(n) away from the ends
+        cards = list(self.cards)
+        random.shuffle(cards)
+        self.cards = deque(cards)
 
     def draw(self) -> Card | None:
         """Draw a card from the top of the deck."""
         if self.cards:
-            return self.cards.pop(0)
+            return self.cards.popleft()
         return None
 
     def draw_non_duplicate(self, hand: list[Card]) -> Card | None:
         """Draw a card that isn't already in the hand (for disallow duplicates mode)."""
         # First try to find a non-duplicate
+        # Values never repeat across card types, so they identify the card kind
+        in_hand = {c.value for c in hand}
         for i, card in enumerate(self.cards):
-            if not any(
-                c.card_type == card.card_type and c.value == card.value for c in hand
-            ):
-                return self.cards.pop(i)
+            if card.value not in in_hand:
+                del self.cards[i]
+                return card
         # Fall back to normal draw if all are duplicates
         return self.draw()
 
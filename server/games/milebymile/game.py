@@ -8,6 +8,7 @@ while playing hazards on opponents and defending with safeties.
 from dataclasses import dataclass, field
 from datetime import datetime
 import random
+import sys
 
 from ..base import Game, Player
 from ..registry import register_game
@@ -27,15 +28,180 @@ from .cards import (
     RemedyType,
     SafetyType,
     HAZARD_TO_SAFETY,
+    REMEDY_TO_HAZARD,
     SAFETY_TO_HAZARD,
 )
 from .options import MileByMileOptions
 from .player import MileByMilePlayer
-from .state import RaceState
+from .state import RaceState, is_critical_problem
 
 # Hand size
 HAND_SIZE = 6
 
+# Card slot action IDs (HAND_SIZE + 1 to account for the card drawn at start of
+# turn, plus one spare so the slot after a full hand can always be checked)
+_CARD_SLOT_IDS = tuple(f"card_slot_{i}" for i in range(1, HAND_SIZE + 3))
+
+# Always show cards in menu, but enable/disable based on state.
+# Use dynamic label to ensure locale changes are reflected.
+# Indexed by slot, then by whether a hazard target menu is needed.
+_CARD_SLOT_ACTIONS = tuple(
+    tuple(
+        Action(
+            id=action_id,
+            label="",  # Fallback, dynamic label used instead
+            handler="_action_play_card",
+            is_enabled="_is_card_action_enabled",
+            is_hidden="_is_card_action_hidden",
+            get_label="_get_card_slot_label",
+            input_request=MenuInput(
+                prompt="milebymile-select-target",
+                options="_hazard_target_options",
+                bot_select="_bot_select_hazard_target",
+                get_label="_get_hazard_target_label",
+            )
+            if needs_menu
+            else None,
+        )
+        for needs_menu in (False, True)
+    )
+    for action_id in _CARD_SLOT_IDS
+)
+
+# Hazard target menu options are stable IDs: this prefix plus the team index
+_HAZARD_TARGET_PREFIX = "hazard_target_"
+
+# Localization keys for card names (hazards double as problem names)
+CARD_NAME_KEYS: dict[str, str] = {
+    # Hazards
+    HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
+    HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
+    HazardType.ACCIDENT: "milebymile-card-accident",
+    HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
+    HazardType.STOP: "milebymile-card-stop",
+    # Remedies
+    RemedyType.GASOLINE: "milebymile-card-gasoline",
+    RemedyType.SPARE_TIRE: "milebymile-card-spare-tire",
+    RemedyType.REPAIRS: "milebymile-card-repairs",
+    RemedyType.END_OF_LIMIT: "milebymile-card-end-of-limit",
+    RemedyType.ROLL: "milebymile-card-green-light",
+    # Safeties
+    SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
+    SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
+    SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
+    SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
+    # Special
+    "false_virtue": "milebymile-card-false-virtue",
+}
+
+# Karma announcement keys as (individual, team) tuples of
+# (actor, target, others) message keys; see _announce_by_role
+_KARMA_CLASH_KEYS = (
+    (
+        "milebymile-karma-clash-you-target",
+        "milebymile-karma-clash-you-attacker",
+        "milebymile-karma-clash-others",
+    ),
+    (
+        "milebymile-karma-clash-your-team",
+        "milebymile-karma-clash-target-team",
+        "milebymile-karma-clash-other-teams",
+    ),
+)
+_KARMA_SHUNNED_KEYS = (
+    ("milebymile-karma-shunned-you", None, "milebymile-karma-shunned-other"),
+    ("milebymile-karma-shunned-your-team", None, "milebymile-karma-shunned-other-team"),
+)
+_FALSE_VIRTUE_KEYS = (
+    ("milebymile-false-virtue-you", None, "milebymile-false-virtue-other"),
+    ("milebymile-false-virtue-your-team", None, "milebymile-false-virtue-other-team"),
+)
+
+# Play handler method names by card type (hazards are dispatched separately
+# since they take a target)
+_PLAY_CARD_HANDLERS: dict[str, str] = {
+    CardType.DISTANCE: "_play_distance",
+    CardType.REMEDY: "_play_remedy",
+    CardType.SAFETY: "_play_safety",
+    CardType.SPECIAL: "_play_special",
+}
+
+# Bot scorer method names by card type (unknown types score a flat 100)
+_BOT_CARD_SCORERS: dict[str, str] = {
+    CardType.DISTANCE: "_bot_score_distance",
+    CardType.REMEDY: "_bot_score_remedy",
+    CardType.SAFETY: "_bot_score_safety",
+    CardType.HAZARD: "_bot_score_hazard",
+    CardType.SPECIAL: "_bot_score_special",
+}
+
+
+# Bot score for a distance card that exactly finishes the race; no card
+# scores higher, so a bot stops scoring its hand once it finds one
+_PERFECT_FINISH_PRIORITY = 5000
+
+
+@dataclass(slots=True)
+class _BotTurn:
+    """Values a bot's card scoring needs, resolved once per decision."""
+
+    race_state: RaceState
+    distance_needed: int
+    is_endgame: bool
+    distance_limit: int
+    only_perfect: bool
+    hold_hazards: bool
+    # Playability by card value; state can't change while a hand is scored
+    playable: dict[str, bool] = field(default_factory=dict)
+
+
+# Shared card table sounds, pre-formatted so a play is a single random.choice
+_PLAY_SOUNDS = tuple(f"game_cards/play{i}.ogg" for i in range(1, 5))
+_DRAW_SOUNDS = tuple(f"game_cards/draw{i}.ogg" for i in range(1, 5))
+_DISCARD_SOUNDS = tuple(f"game_cards/discard{i}.ogg" for i in range(1, 4))
+_SHUFFLE_SOUNDS = tuple(f"game_cards/shuffle{i}.ogg" for i in range(1, 4))
+
+
+def _sound_variants(template: str, count: int) -> tuple[str, ...]:
+    """Expand a sound path template into its numbered variants (1..count)."""
+    return tuple(template.format(i) for i in range(1, count + 1))
+
+
+# Card-specific sounds keyed by card value; one is picked at random
+_CARD_SOUNDS: dict[str, tuple[str, ...]] = {
+    # Distance
+    "25": _sound_variants("game_milebymile/25miles{}.ogg", 2),
+    "50": _sound_variants("game_milebymile/50miles{}.ogg", 3),
+    "75": _sound_variants("game_milebymile/75miles{}.ogg", 3),
+    "100": _sound_variants("game_milebymile/100miles{}.ogg", 3),
+    "200": _sound_variants("game_milebymile/200miles{}.ogg", 3),
+    # Hazards
+    HazardType.ACCIDENT: _sound_variants("game_milebymile/crash{}.ogg", 2),
+    HazardType.OUT_OF_GAS: ("game_milebymile/outofgas.ogg",),
+    HazardType.FLAT_TIRE: ("game_milebymile/flat.ogg",),
+    HazardType.STOP: ("game_milebymile/stop.ogg",),
+    HazardType.SPEED_LIMIT: ("game_milebymile/speedlimit.ogg",),
+    # Remedies
+    RemedyType.END_OF_LIMIT: ("game_milebymile/speedlimitend.ogg",),
+    RemedyType.ROLL: _sound_variants("game_milebymile/greenlight{}.ogg", 3),
+    RemedyType.GASOLINE: ("game_milebymile/gas.ogg",),
+    RemedyType.SPARE_TIRE: ("game_milebymile/sparetyre.ogg",),
+    RemedyType.REPAIRS: _sound_variants("game_milebymile/repair{}.ogg", 2),
+    # Safeties
+    SafetyType.DRIVING_ACE: ("game_milebymile/drivingace.ogg",),
+    SafetyType.EXTRA_TANK: _sound_variants("game_milebymile/extratank{}.ogg", 2),
+    SafetyType.PUNCTURE_PROOF: ("game_milebymile/punctureproof.ogg",),
+    SafetyType.RIGHT_OF_WAY: ("game_milebymile/rightofway.ogg",),
+}
+
+# Localized distance card names keyed by (locale, value); other card names
+# are plain messages and already cached by Localization
+_distance_name_cache: dict[tuple[str, str], str] = {}
+
+# Joined status text for problem/safety lists, keyed by (locale, values in
+# play order). Few distinct combinations exist, so this fills up quickly.
+_card_value_list_cache: dict[tuple[str, tuple[str, ...]], str] = {}
+
 
 @dataclass
 @register_game
@@ -54,9 +220,9 @@ class MileByMileGame(Game):
     # Game state
     deck: Deck = field(default_factory=Deck)
     discard_pile: list[Card] = field(default_factory=list)
-    protections_pile: list[Card] = field(
+    protections_pile: list[int] = field(
         default_factory=list
-    )  # Safeties, never reshuffled
+    )  # IDs of safeties and specials, never reshuffled
     race_states: list[RaceState] = field(default_factory=list)  # Per-team race state
     current_race: int = 0
     race_winner_team_index: int | None = None
@@ -70,6 +236,14 @@ class MileByMileGame(Game):
     round_timer_state: str = "idle"
     round_timer_ticks: int = 0
 
+    @classmethod
+    def __pre_deserialize__(cls, d: dict) -> dict:
+        # Older saves embedded whole cards in the protections pile; keep their IDs
+        pile = d.get("protections_pile")
+        if pile and isinstance(pile[0], dict):
+            d = {**d, "protections_pile": [card["id"] for card in pile]}
+        return d
+
     def __post_init__(self):
         """Initialize runtime state."""
         super().__post_init__()
@@ -140,7 +314,13 @@ class MileByMileGame(Game):
 
     def get_player_race_state(self, player: MileByMilePlayer) -> RaceState | None:
         """Get the race state for a player's team."""
-        return self.get_race_state(player.team_index)
+        # Same as get_race_state(player.team_index), minus a call per lookup;
+        # this runs for every card in hand on each menu rebuild
+        team_index = player.team_index
+        race_states = self.race_states
+        if 0 <= team_index < len(race_states):
+            return race_states[team_index]
+        return None
 
     def get_team_name(self, team_index: int) -> str:
         """Get display name for a team by index."""
@@ -152,6 +332,12 @@ class MileByMileGame(Game):
         """Check if game is in individual mode."""
         return self.options.team_mode == "individual"
 
+    def _mode_key(self, base_key: str) -> str:
+        """Get the -individual or -team variant of a message key."""
+        if self.options.team_mode == "individual":
+            return f"{base_key}-individual"
+        return f"{base_key}-team"
+
     def get_num_teams(self) -> int:
         """Get the number of teams."""
         return len(self._team_manager.teams)
@@ -177,6 +363,13 @@ class MileByMileGame(Game):
         for i, race_state in enumerate(self.race_states):
             yield i, race_state
 
+    def iter_opponent_teams(self, team_index: int):
+        """Iterate over (team_index, race_state) pairs for every other team."""
+        # Slice around our own team rather than comparing indices per team
+        race_states = self.race_states
+        yield from enumerate(race_states[:team_index])
+        yield from enumerate(race_states[team_index + 1 :], team_index + 1)
+
     # ==========================================================================
     # Action Sets
     # ==========================================================================
@@ -279,51 +472,50 @@ class MileByMileGame(Game):
             "backspace", "Discard card", ["junk_card"], state=KeybindState.ACTIVE
         )
 
-    def _update_card_actions(self, player: MileByMilePlayer) -> None:
-        """Update card slot actions based on player's hand."""
+    def _update_card_actions(
+        self,
+        player: MileByMilePlayer,
+        needs_menu_cache: dict[tuple[int, str], bool] | None = None,
+    ) -> None:
+        """
+        Update card slot actions based on player's hand.
+
+        Args:
+            player: The player whose card actions to update.
+            needs_menu_cache: Optional (team_index, hazard) -> needs target
+                menu cache, shared when updating several players at once.
+        """
         turn_set = self.get_action_set(player, "turn")
         if not turn_set:
             return
 
-        # Remove old card actions and ensure they're removed from _order
-        # Note: HAND_SIZE + 2 to account for the card drawn at start of turn
-        for i in range(1, HAND_SIZE + 2):
-            action_id = f"card_slot_{i}"
-            if turn_set.get_action(action_id):
-                turn_set.remove(action_id)
-            # Also ensure it's not lingering in _order
-            if action_id in turn_set._order:
-                turn_set._order.remove(action_id)
-
-        # Add actions for cards in hand
-        for i, card in enumerate(player.hand, 1):
-            action_id = f"card_slot_{i}"
-            playable = self._can_play_card(player, card)
-
-            # Check if hazard with multiple targets needs menu
-            input_request = None
-            if card.card_type == CardType.HAZARD and playable:
-                targets = self._get_valid_hazard_targets(player, card.value)
-                if len(targets) > 1:
-                    input_request = MenuInput(
-                        prompt="milebymile-select-target",
-                        options="_hazard_target_options",
-                        bot_select="_bot_select_hazard_target",
-                    )
+        # Pick the slot action for each card in hand. A hazard with multiple
+        # targets needs a target menu; duplicate cards (e.g. two Flat Tires),
+        # and teammates holding the same hazard, share one target scan.
+        if needs_menu_cache is None:
+            needs_menu_cache = {}
+        wanted: list[Action] = []
+        for i, card in enumerate(player.hand):
+            needs_menu = False
+            if card.card_type == CardType.HAZARD:
+                key = (player.team_index, card.value)
+                needs_menu = needs_menu_cache.get(key)
+                if needs_menu is None:
+                    _, targets = self._compute_hazard_state(player, card.value)
+                    needs_menu = targets is not None
+                    needs_menu_cache[key] = needs_menu
+            wanted.append(_CARD_SLOT_ACTIONS[i][needs_menu])
+
+        # Labels and enabled state are resolved dynamically, so if every slot
+        # already holds the right action there is nothing to rebuild
+        if turn_set.get_action(_CARD_SLOT_IDS[len(wanted)]) is None and all(
+            turn_set.get_action(action.id) == action for action in wanted
+        ):
+            return
 
-            # Always show cards in menu, but enable/disable based on state
-            # Use dynamic label to ensure locale changes are reflected
-            turn_set.add(
-                Action(
-                    id=action_id,
-                    label="",  # Fallback, dynamic label used instead
-                    handler="_action_play_card",
-                    is_enabled="_is_card_action_enabled",
-                    is_hidden="_is_card_action_hidden",
-                    get_label="_get_card_slot_label",
-                    input_request=input_request,
-                )
-            )
+        # Remove old card actions and add the new ones in hand order
+        turn_set.remove_many(_CARD_SLOT_IDS)
+        turn_set.add_many(wanted)
 
         # Move check_status to the end (after card actions)
         if "check_status" in turn_set._order:
@@ -393,7 +585,7 @@ class MileByMileGame(Game):
             return ""
         # Extract slot number from action_id (e.g., "card_slot_1" -> 0)
         try:
-            slot = int(action_id.split("_")[-1]) - 1
+            slot = int(action_id.rpartition("_")[2]) - 1
         except (ValueError, IndexError):
             return ""
         if slot < 0 or slot >= len(player.hand):
@@ -403,14 +595,21 @@ class MileByMileGame(Game):
         locale = user.locale if user else "en"
         return self._get_localized_card_name(card, locale)
 
-    def _update_turn_actions(self, player: MileByMilePlayer) -> None:
+    def _update_turn_actions(
+        self,
+        player: MileByMilePlayer,
+        needs_menu_cache: dict[tuple[int, str], bool] | None = None,
+    ) -> None:
         """Update dynamic card actions for a player."""
-        self._update_card_actions(player)
+        self._update_card_actions(player, needs_menu_cache)
 
     def _update_all_turn_actions(self) -> None:
         """Update card actions for all players."""
+        # Target menus depend only on the attacking team, so teammates
+        # share hazard scans within one update
+        needs_menu_cache: dict[tuple[int, str], bool] = {}
         for player in self.players:
-            self._update_turn_actions(player)
+            self._update_turn_actions(player, needs_menu_cache)
 
     # ==========================================================================
     # Card Logic
@@ -439,8 +638,6 @@ class MileByMileGame(Game):
         self, player: MileByMilePlayer, card: Card, locale: str = "en"
     ) -> str:
         """Get a human-readable reason why a card can't be played."""
-        from ...messages.localization import Localization
-
         race_state = self.get_player_race_state(player)
         if not race_state:
             return Localization.get(locale, "milebymile-reason-not-on-team")
@@ -477,7 +674,7 @@ class MileByMileGame(Game):
                     return Localization.get(locale, "milebymile-reason-already-moving")
                 # Check for other problems
                 for problem in race_state.problems:
-                    if problem not in (HazardType.STOP, HazardType.SPEED_LIMIT):
+                    if problem != HazardType.STOP and is_critical_problem(problem):
                         problem_name = self._get_localized_problem_name(problem, locale)
                         return Localization.get(
                             locale,
@@ -502,117 +699,102 @@ class MileByMileGame(Game):
 
     def _get_localized_problem_name(self, problem: str, locale: str) -> str:
         """Get localized name for a problem/hazard type."""
-        from ...messages.localization import Localization
-
-        key_map = {
-            HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
-            HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
-            HazardType.ACCIDENT: "milebymile-card-accident",
-            HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
-            HazardType.STOP: "milebymile-card-stop",
-        }
-        key = key_map.get(problem, "")
+        key = CARD_NAME_KEYS.get(problem)
         return Localization.get(locale, key) if key else problem
 
-    def _get_localized_safety_name(self, safety: str, locale: str) -> str:
-        """Get localized name for a safety type."""
-        from ...messages.localization import Localization
-
-        key_map = {
-            SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
-            SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
-            SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
-            SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
-        }
-        key = key_map.get(safety, "")
-        return Localization.get(locale, key) if key else safety
+    def _format_card_value_list(self, values: list[str], locale: str) -> str:
+        """Join localized problem/safety names for status output, or 'none'."""
+        key = (locale, tuple(values))
+        text = _card_value_list_cache.get(key)
+        if text is None:
+            if values:
+                # Problems and safeties share the card name table
+                text = ", ".join(
+                    self._get_localized_problem_name(v, locale) for v in values
+                )
+            else:
+                text = Localization.get(locale, "milebymile-none")
+            _card_value_list_cache[key] = text
+        return text
 
     def _get_localized_card_name(self, card: Card, locale: str) -> str:
         """Get localized name for a card."""
-        from ...messages.localization import Localization
-
         if card.card_type == CardType.DISTANCE:
-            return Localization.get(locale, "milebymile-card-miles", miles=card.value)
-
-        key_map = {
-            # Hazards
-            HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
-            HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
-            HazardType.ACCIDENT: "milebymile-card-accident",
-            HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
-            HazardType.STOP: "milebymile-card-stop",
-            # Remedies
-            RemedyType.GASOLINE: "milebymile-card-gasoline",
-            RemedyType.SPARE_TIRE: "milebymile-card-spare-tire",
-            RemedyType.REPAIRS: "milebymile-card-repairs",
-            RemedyType.END_OF_LIMIT: "milebymile-card-end-of-limit",
-            RemedyType.ROLL: "milebymile-card-green-light",
-            # Safeties
-            SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
-            SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
-            SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
-            SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
-            # Special
-            "false_virtue": "milebymile-card-false-virtue",
-        }
-        key = key_map.get(card.value, "")
+            key = (locale, card.value)
+            name = _distance_name_cache.get(key)
+            if name is None:
+                name = Localization.get(locale, "milebymile-card-miles", miles=card.value)
+                _distance_name_cache[key] = name
+            return name
+
+        key = CARD_NAME_KEYS.get(card.value)
         return Localization.get(locale, key) if key else card.name
 
     def _can_play_distance(self, race_state: RaceState, card: Card) -> bool:
         """Check if team can play a distance card."""
+        return card.distance <= self._get_distance_limit(race_state)
+
+    def _get_distance_limit(self, race_state: RaceState) -> int:
+        """
+        Get the largest distance card the team can currently play.
+
+        Returns 0 if no distance card is playable. Callers checking a whole
+        hand compute this once instead of re-checking the team per card.
+        """
         if not race_state.can_play_distance():
-            return False
+            return 0
 
-        distance = card.distance
+        limit = sys.maxsize
 
         # Check speed limit
-        if race_state.has_problem(HazardType.SPEED_LIMIT) and distance > 50:
-            return False
+        if race_state.has_problem(HazardType.SPEED_LIMIT):
+            limit = 50
 
         # Check perfect crossing
         if self.options.only_allow_perfect_crossing:
-            if race_state.miles + distance > self.options.round_distance:
-                return False
+            limit = min(limit, self.options.round_distance - race_state.miles)
 
-        return True
+        return limit
 
     def _can_play_hazard(self, player: MileByMilePlayer, card: Card) -> bool:
         """Check if hazard can be played on any opponent."""
+        return next(self._iter_hazard_targets(player, card.value), None) is not None
+
+    def _iter_hazard_targets(self, player: MileByMilePlayer, hazard: str):
+        """
+        Yield the team indices a hazard can be played on, in team order.
+
+        A target is skipped if it has the safety that blocks the hazard, or
+        if the karma rule is on and the attacker has lost karma while the
+        target still has it. Speed limit (or any hazard when stacking
+        attacks is allowed) only needs the target not to already have that
+        hazard; other hazards need a target with no critical problems.
+        The per-hazard and per-attacker parts are resolved once, not per
+        target.
+        """
         attacker_state = self.get_player_race_state(player)
         if not attacker_state:
-            return False
-
-        for target_idx, target_state in self.iter_teams():
-            if target_idx == player.team_index:
-                continue
-            if self._can_play_hazard_on_team(card.value, target_state, attacker_state):
-                return True
-        return False
+            return
 
-    def _can_play_hazard_on_team(
-        self, hazard: str, target: RaceState, attacker: RaceState
-    ) -> bool:
-        """Check if hazard can be played on a specific team."""
-        # Check if target has blocking safety
         blocking_safety = HAZARD_TO_SAFETY.get(hazard)
-        if blocking_safety and target.has_safety(blocking_safety):
-            return False
-
-        # Karma rule check
-        if self.options.karma_rule:
-            if not attacker.has_karma and target.has_karma:
-                return False
-
-        # Check for existing problems
-        if hazard == HazardType.SPEED_LIMIT:
-            # Speed limit just checks for duplicate
-            return not target.has_problem(hazard)
-        else:
-            # Critical hazards: can't stack unless option enabled
-            if self.options.allow_stacking_attacks:
-                return not target.has_problem(hazard)
-            else:
-                return not target.has_any_problem()
+        # Karma rule: a team without karma can't attack a team that has it
+        karma_blocked = self.options.karma_rule and not attacker_state.has_karma
+        # Speed limit (or any hazard with stacking) only checks for a duplicate;
+        # otherwise critical hazards need a target with no critical problems
+        duplicate_only = (
+            hazard == HazardType.SPEED_LIMIT or self.options.allow_stacking_attacks
+        )
+        for target_idx, target in self.iter_opponent_teams(player.team_index):
+            if blocking_safety and blocking_safety in target.safeties:
+                continue
+            if karma_blocked and target.has_karma:
+                continue
+            if duplicate_only:
+                if hazard in target.problems:
+                    continue
+            elif target.has_any_problem():
+                continue
+            yield target_idx
 
     def _can_play_remedy(self, race_state: RaceState, card: Card) -> bool:
         """Check if remedy can be played."""
@@ -629,35 +811,38 @@ class MileByMileGame(Game):
             if not race_state.has_problem(HazardType.STOP):
                 return False
             # Can't have other problems (except speed limit)
-            for problem in race_state.problems:
-                if problem not in (HazardType.STOP, HazardType.SPEED_LIMIT):
-                    return False
-            return True
+            return not race_state.has_problem_besides_stop()
 
         # Specific remedies
-        remedy_to_hazard = {
-            RemedyType.GASOLINE: HazardType.OUT_OF_GAS,
-            RemedyType.SPARE_TIRE: HazardType.FLAT_TIRE,
-            RemedyType.REPAIRS: HazardType.ACCIDENT,
-        }
-        hazard = remedy_to_hazard.get(remedy)
-        return hazard and race_state.has_problem(hazard)
+        hazard = REMEDY_TO_HAZARD.get(remedy)
+        return hazard is not None and race_state.has_problem(hazard)
+
+    def _compute_hazard_state(
+        self, player: MileByMilePlayer, hazard: str
+    ) -> tuple[bool, list[int] | None]:
+        """
+        Check a hazard against all opponents in a single pass.
+
+        Returns:
+            (playable, targets) where targets is only built when there is
+            more than one valid target (i.e. a target menu is needed).
+        """
+        first_target: int | None = None
+        targets: list[int] | None = None
+        for target_idx in self._iter_hazard_targets(player, hazard):
+            if first_target is None:
+                first_target = target_idx
+            elif targets is None:
+                targets = [first_target, target_idx]
+            else:
+                targets.append(target_idx)
+        return first_target is not None, targets
 
     def _get_valid_hazard_targets(
         self, player: MileByMilePlayer, hazard: str
     ) -> list[int]:
         """Get list of team indices that can be targeted by a hazard."""
-        attacker_state = self.get_player_race_state(player)
-        if not attacker_state:
-            return []
-
-        targets = []
-        for target_idx, target_state in self.iter_teams():
-            if target_idx == player.team_index:
-                continue
-            if self._can_play_hazard_on_team(hazard, target_state, attacker_state):
-                targets.append(target_idx)
-        return targets
+        return list(self._iter_hazard_targets(player, hazard))
 
     # ==========================================================================
     # Action Handlers
@@ -669,10 +854,7 @@ class MileByMileGame(Game):
         if not user:
             return
 
-        from ...messages.localization import Localization
-
         locale = user.locale
-        none_str = Localization.get(locale, "milebymile-none")
 
         for team_idx, race_state in self.iter_teams():
             name = self.get_team_name(team_idx)
@@ -681,18 +863,8 @@ class MileByMileGame(Game):
             team = self._team_manager.teams[team_idx] if team_idx < len(self._team_manager.teams) else None
             score = team.total_score if team else 0
 
-            if race_state.problems:
-                problems_str = ", ".join(
-                    self._get_localized_problem_name(p, locale) for p in race_state.problems
-                )
-            else:
-                problems_str = none_str
-            if race_state.safeties:
-                safeties_str = ", ".join(
-                    self._get_localized_safety_name(s, locale) for s in race_state.safeties
-                )
-            else:
-                safeties_str = none_str
+            problems_str = self._format_card_value_list(race_state.problems, locale)
+            safeties_str = self._format_card_value_list(race_state.safeties, locale)
 
             user.speak_l(
                 "milebymile-status",
@@ -709,10 +881,7 @@ class MileByMileGame(Game):
         if not user:
             return
 
-        from ...messages.localization import Localization
-
         locale = user.locale
-        none_str = Localization.get(locale, "milebymile-none")
         lines = []
 
         for team_idx, race_state in self.iter_teams():
@@ -722,21 +891,8 @@ class MileByMileGame(Game):
             team = self._team_manager.teams[team_idx] if team_idx < len(self._team_manager.teams) else None
             score = team.total_score if team else 0
 
-            # Format problems
-            if race_state.problems:
-                problems_str = ", ".join(
-                    self._get_localized_problem_name(p, locale) for p in race_state.problems
-                )
-            else:
-                problems_str = none_str
-
-            # Format safeties
-            if race_state.safeties:
-                safeties_str = ", ".join(
-                    self._get_localized_safety_name(s, locale) for s in race_state.safeties
-                )
-            else:
-                safeties_str = none_str
+            problems_str = self._format_card_value_list(race_state.problems, locale)
+            safeties_str = self._format_card_value_list(race_state.safeties, locale)
 
             # Add team status line (one line per team)
             lines.append(f"{name}: {score} points, {race_state.miles} miles, Problems: {problems_str}, Safeties: {safeties_str}")
@@ -752,39 +908,46 @@ class MileByMileGame(Game):
         if not race_state or self.dirty_trick_window_team != player.team_index:
             return
 
-        hazard = self.dirty_trick_window_hazard
-        if not hazard:
-            return
-
-        # Find matching safety in hand
-        blocking_safety = HAZARD_TO_SAFETY.get(hazard)
+        blocking_safety = self._get_dirty_trick_safety()
         if not blocking_safety:
             return
 
-        safety_card = None
-        card_index = -1
-        for i, card in enumerate(player.hand):
-            if card.card_type == CardType.SAFETY and card.value == blocking_safety:
-                safety_card = card
-                card_index = i
-                break
-
-        if not safety_card:
+        # Find matching safety in hand
+        card_index = self._find_safety_in_hand(player, blocking_safety)
+        if card_index is None:
             user = self.get_user(player)
             if user:
                 user.speak_l("milebymile-no-matching-safety")
             return
 
         # Play the dirty trick!
-        self._play_safety(player, card_index, safety_card, is_dirty_trick=True)
+        self._play_safety(
+            player, card_index, player.hand[card_index], is_dirty_trick=True
+        )
 
         # Close the window
         self.dirty_trick_window_team = None
         self.dirty_trick_window_hazard = None
         self.dirty_trick_window_ticks = 0
 
+    def _get_dirty_trick_safety(self) -> str | None:
+        """Get the safety that blocks the hazard in the open dirty trick window."""
+        hazard = self.dirty_trick_window_hazard
+        if not hazard:
+            return None
+        return HAZARD_TO_SAFETY.get(hazard)
+
+    def _find_safety_in_hand(
+        self, player: MileByMilePlayer, safety: str
+    ) -> int | None:
+        """Get the hand index of a safety card, or None if not held."""
+        for i, card in enumerate(player.hand):
+            if card.value == safety and card.card_type == CardType.SAFETY:
+                return i
+        return None
+
     def _hazard_target_options(self, player: Player) -> list[str]:
-        """Get list of valid hazard target names for menu input."""
+        """Get list of valid hazard target IDs for menu input."""
         if not isinstance(player, MileByMilePlayer):
             return []
 
@@ -794,7 +957,7 @@ class MileByMileGame(Game):
             return []
 
         try:
-            slot = int(action_id.split("_")[-1]) - 1
+            slot = int(action_id.rpartition("_")[2]) - 1
         except ValueError:
             return []
 
@@ -806,17 +969,32 @@ class MileByMileGame(Game):
             return []
 
         target_indices = self._get_valid_hazard_targets(player, card.value)
+        return [f"{_HAZARD_TARGET_PREFIX}{team_idx}" for team_idx in target_indices]
+
+    def _get_hazard_target_label(self, player: Player, option: str) -> str:
+        """Get the menu text for a hazard target ID."""
+        team_idx = self._parse_hazard_target(option)
+        if team_idx is None:
+            return option
+        race_state = self.race_states[team_idx]
+        team = self._team_manager.teams[team_idx]
         # Format like v10: "Name (X miles)" for individual, "Team N: members (X miles)" for teams
-        options = []
-        for team_idx in target_indices:
-            race_state = self.race_states[team_idx]
-            team = self._team_manager.teams[team_idx]
-            if self.is_individual_mode():
-                options.append(f"{team.members[0]} ({race_state.miles} miles)")
-            else:
-                members = ", ".join(team.members)
-                options.append(f"Team {team_idx + 1}: {members} ({race_state.miles} miles)")
-        return options
+        if self.is_individual_mode():
+            return f"{team.members[0]} ({race_state.miles} miles)"
+        members = ", ".join(team.members)
+        return f"Team {team_idx + 1}: {members} ({race_state.miles} miles)"
+
+    def _parse_hazard_target(self, option: str) -> int | None:
+        """Get the team index from a hazard target ID, or None if invalid."""
+        if not option.startswith(_HAZARD_TARGET_PREFIX):
+            return None
+        try:
+            team_idx = int(option[len(_HAZARD_TARGET_PREFIX) :])
+        except ValueError:
+            return None
+        if 0 <= team_idx < len(self.race_states):
+            return team_idx
+        return None
 
     def _bot_select_hazard_target(
         self, player: Player, options: list[str]
@@ -830,7 +1008,7 @@ class MileByMileGame(Game):
             return None
 
         try:
-            slot = int(action_id.split("_")[-1]) - 1
+            slot = int(action_id.rpartition("_")[2]) - 1
         except ValueError:
             return None
 
@@ -847,14 +1025,7 @@ class MileByMileGame(Game):
 
         # Pick target with most miles
         best_idx = max(target_indices, key=lambda i: self.race_states[i].miles)
-        race_state = self.race_states[best_idx]
-        team = self._team_manager.teams[best_idx]
-        # Return in same format as _hazard_target_options
-        if self.is_individual_mode():
-            return f"{team.members[0]} ({race_state.miles} miles)"
-        else:
-            members = ", ".join(team.members)
-            return f"Team {best_idx + 1}: {members} ({race_state.miles} miles)"
+        return f"{_HAZARD_TARGET_PREFIX}{best_idx}"
 
     def _action_play_card(self, player: Player, *args) -> None:
         """Handle playing a card from hand.
@@ -881,7 +1052,7 @@ class MileByMileGame(Game):
 
         # Extract slot number from action_id (e.g., "card_slot_1" -> 0)
         try:
-            slot = int(action_id.split("_")[-1]) - 1
+            slot = int(action_id.rpartition("_")[2]) - 1
         except ValueError:
             return
 
@@ -924,7 +1095,7 @@ class MileByMileGame(Game):
 
         # Extract slot number from menu_item_id
         try:
-            slot = int(menu_item_id.split("_")[-1]) - 1
+            slot = int(menu_item_id.rpartition("_")[2]) - 1
         except ValueError:
             return
 
@@ -951,16 +1122,19 @@ class MileByMileGame(Game):
         target_name: str | None = None,
     ) -> None:
         """Play a card from hand."""
-        if card.card_type == CardType.DISTANCE:
-            self._play_distance(player, slot, card)
-        elif card.card_type == CardType.HAZARD:
+        if card.card_type == CardType.HAZARD:
+            # Only hazards take a target
             self._play_hazard(player, slot, card, target_name)
-        elif card.card_type == CardType.REMEDY:
-            self._play_remedy(player, slot, card)
-        elif card.card_type == CardType.SAFETY:
-            self._play_safety(player, slot, card, is_dirty_trick=False)
-        elif card.card_type == CardType.SPECIAL:
-            self._play_special(player, slot, card)
+            return
+        handler = _PLAY_CARD_HANDLERS.get(card.card_type)
+        if handler:
+            getattr(self, handler)(player, slot, card)
+
+    def _play_card_sound(self, card: Card) -> None:
+        """Play the card-specific sound for a card, if it has one."""
+        sounds = _CARD_SOUNDS.get(card.value)
+        if sounds:
+            self.play_sound(random.choice(sounds))
 
     def _play_distance(self, player: MileByMilePlayer, slot: int, card: Card) -> None:
         """Play a distance card."""
@@ -976,56 +1150,34 @@ class MileByMileGame(Game):
             race_state.used_200_mile = True
 
         # Play sounds
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(random.choice(_PLAY_SOUNDS))
 
         # Distance-specific sounds
-        sound_variants = {25: 2, 50: 3, 75: 3, 100: 3, 200: 3}
-        if distance in sound_variants:
-            variant = random.randint(1, sound_variants[distance])
-            self.play_sound(f"game_milebymile/{distance}miles{variant}.ogg")
+        self._play_card_sound(card)
 
         # Announce
-        if self.is_individual_mode():
-            self.broadcast_l(
-                "milebymile-plays-distance-individual",
-                player=player.name,
-                distance=distance,
-                total=race_state.miles,
-            )
-        else:
-            self.broadcast_l(
-                "milebymile-plays-distance-team",
-                player=player.name,
-                distance=distance,
-                total=race_state.miles,
-            )
+        self.broadcast_l(
+            self._mode_key("milebymile-plays-distance"),
+            player=player.name,
+            distance=distance,
+            total=race_state.miles,
+        )
 
         self.discard_pile.append(card)
 
         # Check for race win
-        if race_state.miles >= self.options.round_distance:
+        round_distance = self.options.round_distance
+        if race_state.miles >= round_distance:
             if (
-                race_state.miles == self.options.round_distance
+                race_state.miles == round_distance
                 and not self.options.only_allow_perfect_crossing
             ):
-                if self.is_individual_mode():
-                    self.broadcast_l(
-                        "milebymile-journey-complete-perfect-individual",
-                        player=player.name,
-                    )
-                else:
-                    self.broadcast_l(
-                        "milebymile-journey-complete-perfect-team", team=player.team_index + 1
-                    )
+                key = "milebymile-journey-complete-perfect"
             else:
-                if self.is_individual_mode():
-                    self.broadcast_l(
-                        "milebymile-journey-complete-individual", player=player.name
-                    )
-                else:
-                    self.broadcast_l(
-                        "milebymile-journey-complete-team", team=player.team_index + 1
-                    )
+                key = "milebymile-journey-complete"
+            self.broadcast_l(
+                self._mode_key(key), player=player.name, team=player.team_index + 1
+            )
 
             self.play_sound("game_milebymile/winround.ogg")
             self.race_winner_team_index = player.team_index
@@ -1054,34 +1206,9 @@ class MileByMileGame(Game):
         # Find target team index
         target_idx: int | None = None
         if target_selection:
-            # Target was selected from menu - parse the selection string
-            # Format: "Name (X miles)" or "Team N: members (X miles)"
-            if self.is_individual_mode():
-                # Extract name from "Name (X miles)"
-                name = (
-                    target_selection.split(" (")[0]
-                    if " (" in target_selection
-                    else target_selection
-                )
-                for idx in target_indices:
-                    team = self._team_manager.teams[idx]
-                    if team.members and team.members[0] == name:
-                        target_idx = idx
-                        break
-            else:
-                # Extract team number from "Team N: members (X miles)"
-                if target_selection.startswith("Team "):
-                    try:
-                        team_num = int(
-                            target_selection.split(":")[0].replace("Team ", "")
-                        )
-                        for idx in target_indices:
-                            if idx + 1 == team_num:
-                                target_idx = idx
-                                break
-                    except (ValueError, IndexError):
-                        pass
-            if target_idx is None:
+            # Target was selected from menu by ID
+            target_idx = self._parse_hazard_target(target_selection)
+            if target_idx not in target_indices:
                 return
         elif len(target_indices) == 1:
             target_idx = target_indices[0]
@@ -1102,24 +1229,10 @@ class MileByMileGame(Game):
                 attacker_state.has_karma = False
                 target_state.has_karma = False
 
-                self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+                self.play_sound(random.choice(_PLAY_SOUNDS))
 
                 # First announce the attack
-                if self.is_individual_mode():
-                    target_name = target_team.members[0]
-                    self._broadcast_card_message(
-                        "milebymile-plays-hazard-individual",
-                        card,
-                        player=player.name,
-                        target=target_name,
-                    )
-                else:
-                    self._broadcast_card_message(
-                        "milebymile-plays-hazard-team",
-                        card,
-                        player=player.name,
-                        team=target_idx + 1,
-                    )
+                self._announce_hazard(player, card, target_idx)
 
                 # Then announce neutralization with personalized messages
                 self._announce_karma_clash(player, player.team_index, target_idx)
@@ -1134,7 +1247,7 @@ class MileByMileGame(Game):
                 attacker_shunned = True
 
         # Apply hazard
-        target_state.battle_pile.append(card)
+        target_state.battle_pile.append(card.id)
         target_state.add_problem(card.value)
 
         # All hazards except speed limit also add stop
@@ -1143,34 +1256,12 @@ class MileByMileGame(Game):
                 target_state.add_problem(HazardType.STOP)
 
         # Announce
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(random.choice(_PLAY_SOUNDS))
 
         # Hazard-specific sounds
-        hazard_sounds = {
-            HazardType.ACCIDENT: f"game_milebymile/crash{random.randint(1, 2)}.ogg",
-            HazardType.OUT_OF_GAS: "game_milebymile/outofgas.ogg",
-            HazardType.FLAT_TIRE: "game_milebymile/flat.ogg",
-            HazardType.STOP: "game_milebymile/stop.ogg",
-            HazardType.SPEED_LIMIT: "game_milebymile/speedlimit.ogg",
-        }
-        if card.value in hazard_sounds:
-            self.play_sound(hazard_sounds[card.value])
+        self._play_card_sound(card)
 
-        if self.is_individual_mode():
-            target_name = target_team.members[0]
-            self._broadcast_card_message(
-                "milebymile-plays-hazard-individual",
-                card,
-                player=player.name,
-                target=target_name,
-            )
-        else:
-            self._broadcast_card_message(
-                "milebymile-plays-hazard-team",
-                card,
-                player=player.name,
-                team=target_idx + 1,
-            )
+        self._announce_hazard(player, card, target_idx)
 
         # Announce karma loss (personalized)
         if attacker_shunned:
@@ -1189,6 +1280,20 @@ class MileByMileGame(Game):
 
         self._end_turn()
 
+    def _announce_hazard(
+        self, player: MileByMilePlayer, card: Card, target_idx: int
+    ) -> None:
+        """Announce a hazard played on a target team."""
+        # Individual messages name the target player, team messages the team
+        target_team = self._team_manager.teams[target_idx]
+        self._broadcast_card_message(
+            self._mode_key("milebymile-plays-hazard"),
+            card,
+            player=player.name,
+            target=target_team.members[0],
+            team=target_idx + 1,
+        )
+
     def _play_remedy(self, player: MileByMilePlayer, slot: int, card: Card) -> None:
         """Play a remedy card."""
         race_state = self.get_player_race_state(player)
@@ -1196,26 +1301,14 @@ class MileByMileGame(Game):
             return
 
         player.hand.pop(slot)
-        race_state.battle_pile.append(card)
+        race_state.battle_pile.append(card.id)
 
-        remedy = card.value
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(random.choice(_PLAY_SOUNDS))
 
-        if remedy == RemedyType.END_OF_LIMIT:
-            race_state.remove_problem(HazardType.SPEED_LIMIT)
-            self.play_sound("game_milebymile/speedlimitend.ogg")
-        elif remedy == RemedyType.ROLL:
-            race_state.remove_problem(HazardType.STOP)
-            self.play_sound(f"game_milebymile/greenlight{random.randint(1, 3)}.ogg")
-        elif remedy == RemedyType.GASOLINE:
-            race_state.remove_problem(HazardType.OUT_OF_GAS)
-            self.play_sound("game_milebymile/gas.ogg")
-        elif remedy == RemedyType.SPARE_TIRE:
-            race_state.remove_problem(HazardType.FLAT_TIRE)
-            self.play_sound("game_milebymile/sparetyre.ogg")
-        elif remedy == RemedyType.REPAIRS:
-            race_state.remove_problem(HazardType.ACCIDENT)
-            self.play_sound(f"game_milebymile/repair{random.randint(1, 2)}.ogg")
+        hazard = REMEDY_TO_HAZARD.get(card.value)
+        if hazard is not None:
+            race_state.remove_problem(hazard)
+        self._play_card_sound(card)
 
         self._broadcast_card_message("milebymile-plays-card", card, player=player.name)
         self.discard_pile.append(card)
@@ -1242,44 +1335,29 @@ class MileByMileGame(Game):
                 "milebymile-plays-dirty-trick", card, player=player.name
             )
             self.play_sound("mention.ogg")
-
-            # Remove the hazard that triggered this
-            hazard = SAFETY_TO_HAZARD.get(card.value)
-            if hazard:
-                race_state.remove_problem(hazard)
-            if card.value == SafetyType.RIGHT_OF_WAY:
-                race_state.remove_problem(HazardType.SPEED_LIMIT)
-                race_state.remove_problem(HazardType.STOP)
-
-            # Clean up remaining stop if no other problems
-            if len(race_state.problems) == 1 and HazardType.STOP in race_state.problems:
-                race_state.remove_problem(HazardType.STOP)
         else:
             self._broadcast_card_message(
                 "milebymile-plays-card", card, player=player.name
             )
-            self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+            self.play_sound(random.choice(_PLAY_SOUNDS))
 
             # Safety-specific sounds
-            safety_sounds = {
-                SafetyType.DRIVING_ACE: "game_milebymile/drivingace.ogg",
-                SafetyType.EXTRA_TANK: f"game_milebymile/extratank{random.randint(1, 2)}.ogg",
-                SafetyType.PUNCTURE_PROOF: "game_milebymile/punctureproof.ogg",
-                SafetyType.RIGHT_OF_WAY: "game_milebymile/rightofway.ogg",
-            }
-            if card.value in safety_sounds:
-                self.play_sound(safety_sounds[card.value])
-
-            # Remove matching problem
-            hazard = SAFETY_TO_HAZARD.get(card.value)
-            if hazard:
-                race_state.remove_problem(hazard)
-            if card.value == SafetyType.RIGHT_OF_WAY:
-                race_state.remove_problem(HazardType.SPEED_LIMIT)
-                race_state.remove_problem(HazardType.STOP)
+            self._play_card_sound(card)
+
+        # Remove matching problem (for a dirty trick, the hazard that triggered it)
+        hazard = SAFETY_TO_HAZARD.get(card.value)
+        if hazard:
+            race_state.remove_problem(hazard)
+        if card.value == SafetyType.RIGHT_OF_WAY:
+            race_state.remove_problem(HazardType.SPEED_LIMIT)
+            race_state.remove_problem(HazardType.STOP)
+
+        # After a dirty trick, clean up remaining stop if no other problems
+        if is_dirty_trick and race_state.problems == [HazardType.STOP]:
+            race_state.remove_problem(HazardType.STOP)
 
         # Safety cards go to protections pile (never reshuffled)
-        self.protections_pile.append(card)
+        self.protections_pile.append(card.id)
 
         # Safety grants extra turn - draw replacement and continue
         new_card = self._draw_card(player)
@@ -1308,12 +1386,12 @@ class MileByMileGame(Game):
 
         if card.value == "false_virtue":
             race_state.has_karma = True
-            self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+            self.play_sound(random.choice(_PLAY_SOUNDS))
 
             # Personalized messages like v10
             self._announce_false_virtue(player, player.team_index)
 
-        self.protections_pile.append(card)
+        self.protections_pile.append(card.id)
         self._end_turn()
 
     def _discard_card(self, player: MileByMilePlayer, slot: int, card: Card) -> None:
@@ -1322,12 +1400,12 @@ class MileByMileGame(Game):
 
         # Safety cards go to protections to prevent reshuffling
         if card.card_type == CardType.SAFETY:
-            self.protections_pile.append(card)
+            self.protections_pile.append(card.id)
         else:
             self.discard_pile.append(card)
 
         self.broadcast_l("milebymile-discards", player=player.name)
-        self.play_sound(f"game_cards/discard{random.randint(1, 3)}.ogg")
+        self.play_sound(random.choice(_DISCARD_SOUNDS))
         self._end_turn()
 
     # ==========================================================================
@@ -1341,10 +1419,10 @@ class MileByMileGame(Game):
                 return None
             # Reshuffle discard pile
             self.deck.add_all(self.discard_pile)
-            self.discard_pile = []
+            self.discard_pile.clear()
             self.deck.shuffle()
             self.broadcast_l("milebymile-deck-reshuffled")
-            self.play_sound(f"game_cards/shuffle{random.randint(1, 3)}.ogg")
+            self.play_sound(random.choice(_SHUFFLE_SOUNDS))
 
         if self.options.rig_game == "No Duplicates":
             return self.deck.draw_non_duplicate(player.hand)
@@ -1425,15 +1503,14 @@ class MileByMileGame(Game):
         )
         self.deck.shuffle()
 
-        self.discard_pile = []
-        self.protections_pile = []
+        self.discard_pile.clear()
+        self.protections_pile.clear()
 
         # Deal hands
         self._deal_initial_hands()
 
         # Play shuffle sound (like Scopa)
-        shuffle_sound = random.choice(["shuffle1.ogg", "shuffle2.ogg", "shuffle3.ogg"])
-        self.play_sound(f"game_cards/{shuffle_sound}")
+        self.play_sound(random.choice(_SHUFFLE_SOUNDS))
         self.broadcast_l("milebymile-new-race")
 
         # Start first turn
@@ -1450,7 +1527,7 @@ class MileByMileGame(Game):
         card = self._draw_card(player)
         if card:
             player.hand.append(card)
-            self.play_sound(f"game_cards/draw{random.randint(1, 4)}.ogg")
+            self.play_sound(random.choice(_DRAW_SOUNDS))
             user = self.get_user(player)
             if user:
                 card_name = self._get_localized_card_name(card, user.locale)
@@ -1477,9 +1554,13 @@ class MileByMileGame(Game):
             return
 
         # Check for deck exhaustion (when reshuffling is disabled)
-        if self.deck.is_empty() and not self.options.reshuffle_discard_pile:
-            # No cards left to draw and can't reshuffle - check if all hands empty
-            all_empty = all(len(p.hand) == 0 for p in self.get_active_players())
+        if not self.options.reshuffle_discard_pile and self.deck.is_empty():
+            # No cards left to draw and can't reshuffle - check if all hands
+            # empty, starting with the player who just played
+            current = self.current_player
+            all_empty = (current is None or not current.hand) and all(
+                not p.hand for p in self.players if not p.is_spectator
+            )
             if all_empty:
                 self._end_race()
                 return
@@ -1494,12 +1575,12 @@ class MileByMileGame(Game):
         # Find winner (team index with most miles if no one reached target)
         winning_team_idx: int | None = self.race_winner_team_index
         if winning_team_idx is None:
-            # Find team with most miles
-            max_miles = -1
-            for team_idx, race_state in self.iter_teams():
-                if race_state.miles > max_miles:
-                    max_miles = race_state.miles
-                    winning_team_idx = team_idx
+            # Find team with most miles (first team wins ties)
+            winning_team_idx = max(
+                range(len(self.race_states)),
+                key=lambda i: self.race_states[i].miles,
+                default=None,
+            )
 
         self.broadcast_l("milebymile-race-complete")
 
@@ -1523,23 +1604,27 @@ class MileByMileGame(Game):
 
     def _calculate_race_scores(self, winning_team_idx: int | None) -> None:
         """Calculate and announce race scores."""
-        from ...messages.localization import Localization
-
+        # A shutout means the winner is the only team that moved at all
+        teams_with_miles = sum(1 for rs in self.race_states if rs.miles > 0)
+        round_distance = self.options.round_distance
+        perfect_forced = self.options.only_allow_perfect_crossing
+        # Team names are announced twice per team (breakdown and totals)
+        team_names = [self.get_team_name(i) for i in range(self.get_num_teams())]
         for team_idx, race_state in self.iter_teams():
-            base_miles = min(race_state.miles, self.options.round_distance)
+            base_miles = min(race_state.miles, round_distance)
             score = base_miles
             # Store bonus keys and their parameters for localization
             bonus_parts: list[tuple[str, dict]] = []  # (message_key, params)
 
             is_winner = team_idx == winning_team_idx
-            if is_winner and race_state.miles >= self.options.round_distance:
+            if is_winner and race_state.miles >= round_distance:
                 # Trip complete bonus
                 score += 400
                 bonus_parts.append(("milebymile-from-trip", {"points": 400}))
 
                 # Perfect crossing (only if not forced)
-                if not self.options.only_allow_perfect_crossing:
-                    if race_state.miles == self.options.round_distance:
+                if not perfect_forced:
+                    if race_state.miles == round_distance:
                         score += 200
                         bonus_parts.append(("milebymile-from-perfect", {"points": 200}))
 
@@ -1548,8 +1633,8 @@ class MileByMileGame(Game):
                     score += 300
                     bonus_parts.append(("milebymile-from-safe", {"points": 300}))
 
-                # Shut out
-                if all(rs.miles == 0 for i, rs in self.iter_teams() if i != team_idx):
+                # Shut out (the winner has miles, so nobody else does)
+                if teams_with_miles == 1:
                     score += 500
                     bonus_parts.append(("milebymile-from-shutout", {"points": 500}))
 
@@ -1584,25 +1669,29 @@ class MileByMileGame(Game):
             self.set_team_round_score(team_idx, score)
             self.add_team_score(team_idx, score)
 
-            # Announce to each player in their locale
-            name = self.get_team_name(team_idx)
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
+            # Announce to each player in their locale (players sharing a
+            # locale share the breakdown text)
+            name = team_names[team_idx]
+            breakdowns: dict[str, str] = {}
+            for _, user in self._iter_audience():
                 locale = user.locale
 
-                # Build localized bonus descriptions
-                bonus_descriptions = [
-                    Localization.get(
-                        locale, "milebymile-from-distance", miles=base_miles
-                    )
-                ]
-                for key, params in bonus_parts:
-                    bonus_descriptions.append(Localization.get(locale, key, **params))
+                breakdown = breakdowns.get(locale)
+                if breakdown is None:
+                    # Build localized bonus descriptions
+                    bonus_descriptions = [
+                        Localization.get(
+                            locale, "milebymile-from-distance", miles=base_miles
+                        )
+                    ]
+                    for key, params in bonus_parts:
+                        bonus_descriptions.append(
+                            Localization.get(locale, key, **params)
+                        )
 
-                # Format list with babel via Localization wrapper
-                breakdown = Localization.format_list_and(locale, bonus_descriptions)
+                    # Format list with babel via Localization wrapper
+                    breakdown = Localization.format_list_and(locale, bonus_descriptions)
+                    breakdowns[locale] = breakdown
                 user.speak_l(
                     "milebymile-earned-points",
                     name=name,
@@ -1612,21 +1701,17 @@ class MileByMileGame(Game):
 
         # Announce total scores
         self.broadcast_l("milebymile-total-scores")
-        for team_idx in range(self.get_num_teams()):
-            name = self.get_team_name(team_idx)
+        for team_idx, name in enumerate(team_names):
             self.broadcast_l("milebymile-team-score", name=name, score=self.get_team_score(team_idx))
 
     def _check_game_winner(self) -> int | None:
         """Check if any team has won the game. Returns team index or None."""
-        for team_idx in range(self.get_num_teams()):
-            if self.get_team_score(team_idx) >= self.options.winning_score:
-                # Find team with highest score
-                best_idx = team_idx
-                for other_idx in range(self.get_num_teams()):
-                    if self.get_team_score(other_idx) > self.get_team_score(best_idx):
-                        best_idx = other_idx
-                return best_idx
-        return None
+        scores = [self.get_team_score(i) for i in range(self.get_num_teams())]
+        best_score = max(scores, default=None)
+        if best_score is None or best_score < self.options.winning_score:
+            return None
+        # Highest score wins (first team wins ties)
+        return scores.index(best_score)
 
     def _end_game(self, winner_idx: int) -> None:
         """End the game with a winner."""
@@ -1696,15 +1781,64 @@ class MileByMileGame(Game):
 
     def _get_player_by_name(self, name: str) -> MileByMilePlayer | None:
         """Get a player by name."""
-        for player in self.players:
-            if player.name == name:
-                return player
-        return None
+        return self.get_player_by_name(name)
 
     # ==========================================================================
     # Karma Announcements (personalized per player like v10)
     # ==========================================================================
 
+    def _iter_audience(self):
+        """Iterate over (player, user) pairs for players with a connected user."""
+        get_user = self.get_user
+        for p in self.players:
+            user = get_user(p)
+            if user:
+                yield p, user
+
+    def _announce_by_role(
+        self,
+        keys: tuple[tuple[str, str | None, str], tuple[str, str | None, str]],
+        actor: MileByMilePlayer,
+        actor_team_idx: int,
+        target_team_idx: int | None = None,
+    ) -> None:
+        """
+        Send each player the message for their role in a karma event.
+
+        Args:
+            keys: (individual, team) tuples of (actor, target, others) message
+                keys. The target key is None for events without a target.
+            actor: The player whose play caused the event.
+            actor_team_idx: The actor's team index.
+            target_team_idx: The targeted team index, if any.
+        """
+        if self.is_individual_mode():
+            actor_key, target_key, other_key = keys[0]
+            params = {"player": actor.name, "attacker": actor.name}
+            target_name = None
+            if target_team_idx is not None:
+                target_name = self._team_manager.teams[target_team_idx].members[0]
+                params["target"] = target_name
+            for p, user in self._iter_audience():
+                if p == actor:
+                    user.speak_l(actor_key)
+                elif target_key and p.name == target_name:
+                    user.speak_l(target_key, **params)
+                else:
+                    user.speak_l(other_key, **params)
+        else:
+            actor_key, target_key, other_key = keys[1]
+            params = {"team": actor_team_idx + 1, "attacker": actor_team_idx + 1}
+            if target_team_idx is not None:
+                params["target"] = target_team_idx + 1
+            for p, user in self._iter_audience():
+                if p.team_index == actor_team_idx:
+                    user.speak_l(actor_key)
+                elif target_key and p.team_index == target_team_idx:
+                    user.speak_l(target_key, **params)
+                else:
+                    user.speak_l(other_key, **params)
+
     def _announce_karma_clash(
         self,
         attacker: MileByMilePlayer,
@@ -1712,103 +1846,33 @@ class MileByMileGame(Game):
         target_team_idx: int,
     ) -> None:
         """Announce when both attacker and target lose karma (attack neutralized)."""
-        if self.is_individual_mode():
-            target_team = self._team_manager.teams[target_team_idx]
-            target_name = target_team.members[0]
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p == attacker:
-                    user.speak_l("milebymile-karma-clash-you-target")
-                elif p.name == target_name:
-                    user.speak_l(
-                        "milebymile-karma-clash-you-attacker", attacker=attacker.name
-                    )
-                else:
-                    user.speak_l(
-                        "milebymile-karma-clash-others",
-                        attacker=attacker.name,
-                        target=target_name,
-                    )
-        else:
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p.team_index == attacker_team_idx:
-                    user.speak_l("milebymile-karma-clash-your-team")
-                elif p.team_index == target_team_idx:
-                    user.speak_l(
-                        "milebymile-karma-clash-target-team",
-                        team=attacker_team_idx + 1,
-                    )
-                else:
-                    user.speak_l(
-                        "milebymile-karma-clash-other-teams",
-                        attacker=attacker_team_idx + 1,
-                        target=target_team_idx + 1,
-                    )
+        self._announce_by_role(
+            _KARMA_CLASH_KEYS, attacker, attacker_team_idx, target_team_idx
+        )
 
     def _announce_attacker_shunned(
         self, attacker: MileByMilePlayer, attacker_team_idx: int
     ) -> None:
         """Announce when attacker loses karma for attacking."""
-        if self.is_individual_mode():
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p == attacker:
-                    user.speak_l("milebymile-karma-shunned-you")
-                else:
-                    user.speak_l("milebymile-karma-shunned-other", player=attacker.name)
-        else:
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p.team_index == attacker_team_idx:
-                    user.speak_l("milebymile-karma-shunned-your-team")
-                else:
-                    user.speak_l(
-                        "milebymile-karma-shunned-other-team",
-                        team=attacker_team_idx + 1,
-                    )
+        self._announce_by_role(_KARMA_SHUNNED_KEYS, attacker, attacker_team_idx)
 
     def _announce_false_virtue(
         self, player: MileByMilePlayer, team_idx: int
     ) -> None:
         """Announce when a player plays False Virtue to regain karma."""
-        if self.is_individual_mode():
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p == player:
-                    user.speak_l("milebymile-false-virtue-you")
-                else:
-                    user.speak_l("milebymile-false-virtue-other", player=player.name)
-        else:
-            for p in self.players:
-                user = self.get_user(p)
-                if not user:
-                    continue
-                if p.team_index == team_idx:
-                    user.speak_l("milebymile-false-virtue-your-team")
-                else:
-                    user.speak_l(
-                        "milebymile-false-virtue-other-team", team=team_idx + 1
-                    )
+        self._announce_by_role(_FALSE_VIRTUE_KEYS, player, team_idx)
 
     def _broadcast_card_message(self, message_key: str, card: Card, **kwargs) -> None:
         """Broadcast a message with a localized card name to all players."""
-        for p in self.players:
-            user = self.get_user(p)
-            if not user:
-                continue
-            card_name = self._get_localized_card_name(card, user.locale)
-            user.speak_l(message_key, card=card_name, **kwargs)
+        texts: dict[str, str] = {}
+        for _, user in self._iter_audience():
+            locale = user.locale
+            text = texts.get(locale)
+            if text is None:
+                card_name = self._get_localized_card_name(card, locale)
+                text = Localization.get(locale, message_key, card=card_name, **kwargs)
+                texts[locale] = text
+            user.speak(text)
 
     # ==========================================================================
     # Bot AI
@@ -1842,15 +1906,11 @@ class MileByMileGame(Game):
         # Check for dirty trick opportunity first
         if self.dirty_trick_window_team is not None:
             if player.team_index == self.dirty_trick_window_team:
-                hazard = self.dirty_trick_window_hazard
-                blocking_safety = HAZARD_TO_SAFETY.get(hazard) if hazard else None
-                if blocking_safety:
-                    for card in player.hand:
-                        if (
-                            card.card_type == CardType.SAFETY
-                            and card.value == blocking_safety
-                        ):
-                            return "dirty_trick"
+                blocking_safety = self._get_dirty_trick_safety()
+                if blocking_safety and (
+                    self._find_safety_in_hand(player, blocking_safety) is not None
+                ):
+                    return "dirty_trick"
 
         # Not our turn? Skip
         if self.current_player != player:
@@ -1872,80 +1932,112 @@ class MileByMileGame(Game):
         distance_needed = target_distance - race_state.miles
         is_endgame = distance_needed <= 200
 
-        # Score each card
-        best_slot = 0
-        best_priority = -1
-
-        for i, card in enumerate(player.hand):
-            priority = self._bot_score_card(
-                player, card, race_state, distance_needed, is_endgame
+        # Score each card (per-turn values are resolved once, not per card)
+        distance_limit = self._get_distance_limit(race_state)
+        # With karma to lose, hold hazards back while a distance card is playable
+        hold_hazards = (
+            self.options.karma_rule
+            and race_state.has_karma
+            and any(
+                c.card_type == CardType.DISTANCE and c.distance <= distance_limit
+                for c in player.hand
             )
-            if priority > best_priority:
-                best_priority = priority
-                best_slot = i
-
+        )
+        turn = _BotTurn(
+            race_state=race_state,
+            distance_needed=distance_needed,
+            is_endgame=is_endgame,
+            distance_limit=distance_limit,
+            only_perfect=self.options.only_allow_perfect_crossing,
+            hold_hazards=hold_hazards,
+        )
+        score_card = self._bot_score_card
+        scores = []
+        for card in player.hand:
+            priority = score_card(player, card, turn)
+            scores.append(priority)
+            if priority >= _PERFECT_FINISH_PRIORITY:
+                break  # Nothing else can beat a perfect finish
+
+        # max keeps the first of equal scores, so earlier slots win ties
+        best_slot = max(range(len(scores)), key=scores.__getitem__)
         return f"card_slot_{best_slot + 1}"
 
     def _bot_score_card(
-        self,
-        player: MileByMilePlayer,
-        card: Card,
-        race_state: RaceState,
-        distance_needed: int,
-        is_endgame: bool,
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
     ) -> int:
         """Score a card for bot decision making."""
-        if card.card_type == CardType.DISTANCE:
-            if not self._can_play_card(player, card):
-                return 100
-
-            distance = card.distance
-            if is_endgame:
-                if distance == distance_needed:
-                    return 5000  # Perfect finish
-                elif distance > distance_needed:
-                    if self.options.only_allow_perfect_crossing:
-                        return 50
-                    return 4000  # Finish anyway
-                else:
-                    return 1000 + distance
-            return 1000 + distance
-
-        elif card.card_type == CardType.REMEDY:
-            if card.value == RemedyType.ROLL and race_state.has_problem(HazardType.STOP):
-                if not race_state.has_safety(SafetyType.RIGHT_OF_WAY):
-                    return 3000
-            if card.value == RemedyType.END_OF_LIMIT and race_state.has_problem(
-                HazardType.SPEED_LIMIT
-            ):
-                return 2800
-            if self._can_play_card(player, card):
-                return 2500
-            return 150
-
-        elif card.card_type == CardType.SAFETY:
-            if race_state.has_safety(card.value):
-                return 50
-            if is_endgame and distance_needed <= 100:
-                return 1500
-            return 2000
+        scorer = _BOT_CARD_SCORERS.get(card.card_type)
+        if scorer is None:
+            return 100
+        return getattr(self, scorer)(player, card, turn)
 
-        elif card.card_type == CardType.HAZARD:
-            if not self._can_play_card(player, card):
-                return 200
-            if self.options.karma_rule and race_state.has_karma:
-                # Prefer not attacking if we have karma and can play distance
-                has_playable_distance = any(
-                    c.card_type == CardType.DISTANCE and self._can_play_card(player, c)
-                    for c in player.hand
-                )
-                if has_playable_distance:
+    def _bot_can_play(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> bool:
+        """Check if a card can be played, once per card kind per decision."""
+        playable = turn.playable.get(card.value)
+        if playable is None:
+            playable = turn.playable[card.value] = self._can_play_card(player, card)
+        return playable
+
+    def _bot_score_distance(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> int:
+        """Score a distance card: finishing the race beats plain progress."""
+        distance = card.distance
+        if distance > turn.distance_limit:
+            return 100
+        if turn.is_endgame:
+            if distance == turn.distance_needed:
+                return _PERFECT_FINISH_PRIORITY
+            if distance > turn.distance_needed:
+                if turn.only_perfect:
                     return 50
-            return 800
+                return 4000  # Finish anyway
+        return 1000 + distance
 
-        elif card.card_type == CardType.SPECIAL:
-            if card.value == "false_virtue" and not race_state.has_karma:
-                return 1800
+    def _bot_score_remedy(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> int:
+        """Score a remedy card: getting moving again comes first."""
+        race_state = turn.race_state
+        if card.value == RemedyType.ROLL and race_state.has_problem(HazardType.STOP):
+            if not race_state.has_safety(SafetyType.RIGHT_OF_WAY):
+                return 3000
+        if card.value == RemedyType.END_OF_LIMIT and race_state.has_problem(
+            HazardType.SPEED_LIMIT
+        ):
+            return 2800
+        if self._bot_can_play(player, card, turn):
+            return 2500
+        return 150
+
+    def _bot_score_safety(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> int:
+        """Score a safety card, holding it back near the finish."""
+        if turn.race_state.has_safety(card.value):
             return 50
+        if turn.is_endgame and turn.distance_needed <= 100:
+            return 1500
+        return 2000
 
-        return 100
+    def _bot_score_hazard(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> int:
+        """Score a hazard card."""
+        if not self._bot_can_play(player, card, turn):
+            return 200
+        if turn.hold_hazards:
+            # Prefer not attacking if we have karma and can play distance
+            return 50
+        return 800
+
+    def _bot_score_special(
+        self, player: MileByMilePlayer, card: Card, turn: _BotTurn
+    ) -> int:
+        """Score a special card (False Virtue only helps without karma)."""
+        if card.value == "false_virtue" and not turn.race_state.has_karma:
+            return 1800
+        return 50
@@ -4,11 +4,11 @@ from dataclasses import dataclass, field
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
-from .cards import Card, HazardType, SafetyType
+from .cards import HazardType, SafetyType
 
 
 # Set of non-critical problems (hazards that don't prevent playing distance cards)
-NON_CRITICAL_PROBLEMS: set[str] = {HazardType.SPEED_LIMIT}
+NON_CRITICAL_PROBLEMS: frozenset[str] = frozenset({HazardType.SPEED_LIMIT})
 
 
 def is_critical_problem(hazard: str) -> bool:
@@ -33,11 +33,26 @@ class RaceState(DataClassJSONMixin):
     miles: int = 0
     problems: list[str] = field(default_factory=list)  # Active hazard types
     safeties: list[str] = field(default_factory=list)  # Played safety types
-    battle_pile: list[Card] = field(default_factory=list)  # Cards played on/by team
+    battle_pile: list[int] = field(default_factory=list)  # IDs of cards played on/by team
     used_200_mile: bool = False
     dirty_trick_count: int = 0
     has_karma: bool = True
 
+    def __post_init__(self):
+        # Runtime-only count of critical problems, kept in sync by
+        # add_problem/remove_problem/reset (not serialized)
+        self._critical_count = sum(
+            1 for p in self.problems if p not in NON_CRITICAL_PROBLEMS
+        )
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict) -> dict:
+        # Older saves embedded whole cards in the battle pile; keep their IDs
+        pile = d.get("battle_pile")
+        if pile and isinstance(pile[0], dict):
+            d = {**d, "battle_pile": [card["id"] for card in pile]}
+        return d
+
     def has_problem(self, problem_type: str) -> bool:
         """Check if team has a specific problem."""
         return problem_type in self.problems
@@ -51,39 +66,52 @@ class RaceState(DataClassJSONMixin):
 
         Non-critical problems like speed limit are excluded.
         """
-        return any(is_critical_problem(p) for p in self.problems)
+        return self._critical_count > 0
 
     def add_problem(self, problem_type: str) -> None:
         """Add a problem to the team."""
         if problem_type not in self.problems:
             self.problems.append(problem_type)
+            if problem_type not in NON_CRITICAL_PROBLEMS:
+                self._critical_count += 1
 
     def remove_problem(self, problem_type: str) -> None:
         """Remove a problem from the team."""
-        if problem_type in self.problems:
+        try:
             self.problems.remove(problem_type)
+        except ValueError:
+            return
+        if problem_type not in NON_CRITICAL_PROBLEMS:
+            self._critical_count -= 1
 
     def add_safety(self, safety_type: str) -> None:
         """Add a safety to the team."""
         if safety_type not in self.safeties:
             self.safeties.append(safety_type)
 
+    def has_problem_besides_stop(self) -> bool:
+        """Check if team has a critical problem other than STOP.
+
+        These are the problems Right of Way and Green Light can't clear
+        (accident, flat tire, out of gas).
+        """
+        stopped = HazardType.STOP in self.problems
+        return self._critical_count > stopped
+
     def can_play_distance(self) -> bool:
         """Check if team can play distance cards."""
-        # Right of Way only protects against STOP and SPEED_LIMIT
-        if self.has_safety(SafetyType.RIGHT_OF_WAY):
-            # Can still be blocked by other problems (accident, flat tire, out of gas)
-            for problem in self.problems:
-                if problem not in (HazardType.STOP, HazardType.SPEED_LIMIT):
-                    return False
-            return True
-        # Otherwise, can't have any critical problems
-        return not self.has_any_problem()
+        # Right of Way only protects against STOP and SPEED_LIMIT; the team
+        # can still be blocked by other problems (accident, flat tire, out of gas).
+        # Otherwise, can't have any critical problems.
+        if SafetyType.RIGHT_OF_WAY in self.safeties:
+            return not self.has_problem_besides_stop()
+        return self._critical_count == 0
 
     def reset(self) -> None:
         """Reset state for a new race."""
         self.miles = 0
         self.problems = [HazardType.STOP]  # Everyone starts stopped
+        self._critical_count = 1
         self.safeties = []
         self.battle_pile = []
         self.used_200_mile = False
@@ -645,7 +645,7 @@ class NinetyNineGame(Game):
             if not self.discard_pile:
                 return None
             # Reshuffle discard pile into deck
-            self.deck.cards = self.discard_pile[:]
+            self.deck.add(self.discard_pile)
             self.discard_pile = []
             self.deck.shuffle()
 
@@ -1039,8 +1039,6 @@ class NinetyNineGame(Game):
 
     def format_end_screen(self, result: GameResult, locale: str) -> list[str]:
         """Format the end screen for NinetyNine game."""
-        from ...messages.localization import Localization
-
         lines = [Localization.get(locale, "game-final-scores")]
 
         final_tokens = result.custom_data.get("final_tokens", {})
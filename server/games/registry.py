@@ -1,15 +1,49 @@
 """Game registry for registering and looking up game types."""
 
+import importlib
 from typing import Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import Game
 
 
+# Game type -> (module under server.games, class name), in menu order.
+# Modules are imported on first lookup; importing one runs its
+# @register_game decorator.
+GAME_MODULES: dict[str, tuple[str, str]] = {
+    "pig": (".pig.game", "PigGame"),
+    "scopa": (".scopa.game", "ScopaGame"),
+    "lightturret": (".lightturret.game", "LightTurretGame"),
+    "threes": (".threes.game", "ThreesGame"),
+    "milebymile": (".milebymile.game", "MileByMileGame"),
+    "chaosbear": (".chaosbear.game", "ChaosBearGame"),
+    "farkle": (".farkle.game", "FarkleGame"),
+    "yahtzee": (".yahtzee.game", "YahtzeeGame"),
+    "ninetynine": (".ninetynine.game", "NinetyNineGame"),
+    "tradeoff": (".tradeoff.game", "TradeoffGame"),
+    "pirates": (".pirates.game", "PiratesGame"),
+    "leftrightcenter": (".leftrightcenter.game", "LeftRightCenterGame"),
+    "tossup": (".tossup.game", "TossUpGame"),
+    "midnight": (".midnight.game", "MidnightGame"),
+    "ageofheroes": (".ageofheroes.game", "AgeOfHeroesGame"),
+    "fivecarddraw": (".fivecarddraw.game", "FiveCardDrawGame"),
+    "holdem": (".holdem.game", "HoldemGame"),
+}
+
+_ORDER = {game_type: i for i, game_type in enumerate(GAME_MODULES)}
+
+
+def _import_game_module(game_type: str):
+    """Import the module defining a known game type."""
+    module_name, _ = GAME_MODULES[game_type]
+    return importlib.import_module(module_name, __package__)
+
+
 class GameRegistry:
     """Registry of all available game types."""
 
     _games: dict[str, Type["Game"]] = {}
+    _all_loaded: bool = False
 
     @classmethod
     def register(cls, game_class: Type["Game"]) -> None:
@@ -17,21 +51,39 @@ class GameRegistry:
         game_type = game_class.get_type()
         cls._games[game_type] = game_class
 
+    @classmethod
+    def load_all(cls) -> None:
+        """Import every known game so all of them are registered."""
+        if cls._all_loaded:
+            return
+        for game_type in GAME_MODULES:
+            _import_game_module(game_type)
+        cls._all_loaded = True
+
     @classmethod
     def get(cls, game_type: str) -> Type["Game"] | None:
         """Get a game class by type."""
-        return cls._games.get(game_type)
+        game_class = cls._games.get(game_type)
+        if game_class is None and game_type in GAME_MODULES:
+            _import_game_module(game_type)
+            game_class = cls._games.get(game_type)
+        return game_class
 
     @classmethod
     def get_all(cls) -> list[Type["Game"]]:
         """Get all registered game classes."""
-        return list(cls._games.values())
+        cls.load_all()
+        # Keep menu order stable regardless of which games were loaded first
+        return sorted(
+            cls._games.values(),
+            key=lambda game_class: _ORDER.get(game_class.get_type(), len(_ORDER)),
+        )
 
     @classmethod
     def get_by_category(cls) -> dict[str, list[Type["Game"]]]:
         """Get games organized by category."""
         categories: dict[str, list[Type["Game"]]] = {}
-        for game_class in cls._games.values():
+        for game_class in cls.get_all():
             category = game_class.get_category()
             if category not in categories:
                 categories[category] = []
@@ -48,3 +100,8 @@ def register_game(game_class: Type["Game"]) -> Type["Game"]:
 def get_game_class(game_type: str) -> Type["Game"] | None:
     """Get a game class by type."""
     return GameRegistry.get(game_type)
+
+
+def load_all_games() -> None:
+    """Import and register every known game."""
+    GameRegistry.load_all()
@@ -117,6 +117,7 @@ saved-table-deleted = Saved table deleted.
 missing-players = Cannot restore: these players are not available: { $players }
 table-restored = Table restored! All players have been transferred.
 table-saved-destroying = Table saved! Returning to main menu.
+table-save-failed = Could not save the table. Your game is still open.
 game-type-not-found = Game type no longer exists.
 
 # Action disabled reasons
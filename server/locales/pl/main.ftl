@@ -109,6 +109,7 @@ saved-table-deleted = usunięto zapisany stół
 missing-players = nie można przywrucić brakujący gracze: { $players }
 table-restored = Przywrócono stół! wszyscy gracze zostali przeniesieni
 table-saved-destroying = Zapisano stół, wracasz do głównego menu.
+table-save-failed = Nie można zapisać stołu. Twoja gra jest nadal otwarta.
 game-type-not-found = Ten typ gry jóż nie istnieje.
 
 # Action disabled reasons
@@ -99,6 +99,7 @@ saved-table-deleted = Mesa salva excluída.
 missing-players = Não é possível restaurar: estes jogadores não estão disponíveis: { $players }
 table-restored = Mesa restaurada! Todos os jogadores foram transferidos.
 table-saved-destroying = Mesa salva! Voltando ao menu principal.
+table-save-failed = Não foi possível salvar a mesa. Seu jogo continua aberto.
 game-type-not-found = Este tipo de jogo não existe mais.
 
 # Placares
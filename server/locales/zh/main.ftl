@@ -98,6 +98,7 @@ saved-table-deleted = 已删除保存的桌台。
 missing-players = 无法恢复：以下玩家不在线：{ $players }
 table-restored = 桌台已恢复！所有玩家已转移。
 table-saved-destroying = 桌台已保存！返回主菜单。
+table-save-failed = 无法保存桌台。你的游戏仍在进行。
 game-type-not-found = 游戏类型不存在。
 
 # 排行榜
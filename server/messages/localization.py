@@ -16,12 +16,15 @@ class Localization:
 
     _bundles: dict[str, FluentBundle] = {}
     _locales_dir: Path | None = None
+    # Rendered messages that take no variables, keyed by (locale, message_id)
+    _plain_messages: dict[tuple[str, str], str] = {}
 
     @classmethod
     def init(cls, locales_dir: Path | str) -> None:
         """Initialize the localization system with a locales directory."""
         cls._locales_dir = Path(locales_dir)
         cls._bundles = {}
+        cls._plain_messages = {}
 
     @classmethod
     def _get_bundle(cls, locale: str) -> FluentBundle:
@@ -72,17 +75,25 @@ class Localization:
         Returns:
             The formatted message string.
         """
+        if not kwargs:
+            cached = cls._plain_messages.get((locale, message_id))
+            if cached is not None:
+                return cached
+
         try:
             bundle = cls._get_bundle(locale)
             result, errors = bundle.format(message_id, kwargs)
             # Strip Unicode bidi isolation characters that Fluent adds
             for char in cls._BIDI_CHARS:
                 result = result.replace(char, "")
-            return result
         except Exception:
             # Return the message ID as fallback
             return message_id
 
+        if not kwargs:
+            cls._plain_messages[(locale, message_id)] = result
+        return result
+
     @classmethod
     def format_list_and(cls, locale: str, items: list[str]) -> str:
         """
@@ -20,8 +20,20 @@ class ClientConnection:
 
     async def send(self, packet: dict) -> None:
         """Send a packet to this client."""
+        await self.send_raw(json.dumps(packet))
+
+    async def send_batch(self, packets: list[dict]) -> None:
+        """Send several packets back-to-back, in order."""
+        try:
+            for packet in packets:
+                await self.websocket.send(json.dumps(packet))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def send_raw(self, frame: str) -> None:
+        """Send an already-serialized packet to this client."""
         try:
-            await self.websocket.send(json.dumps(packet))
+            await self.websocket.send(frame)
         except websockets.exceptions.ConnectionClosed:
             pass
 
@@ -124,9 +136,10 @@ class WebSocketServer:
         self, packet: dict, exclude: ClientConnection | None = None
     ) -> None:
         """Broadcast a packet to all authenticated clients."""
+        frame = json.dumps(packet)
         for client in self._clients.values():
             if client.authenticated and client != exclude:
-                await client.send(packet)
+                await client.send_raw(frame)
 
     async def send_to_user(self, username: str, packet: dict) -> bool:
         """Send a packet to a specific user."""
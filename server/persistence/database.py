@@ -1,13 +1,26 @@
 """SQLite database for persistence."""
 
+import functools
 import sqlite3
 import json
+import threading
 from pathlib import Path
 from dataclasses import dataclass
 
 from ..tables.table import Table
 
 
+def _locked(method):
+    """Run a Database method while holding the connection lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 @dataclass
 class UserRecord:
     """A user record from the database."""
@@ -43,13 +56,20 @@ class Database:
     def __init__(self, db_path: str | Path = "playpalace.db"):
         self.db_path = Path(db_path)
         self._conn: sqlite3.Connection | None = None
+        # The connection is shared with worker threads; each method holds
+        # this lock so one caller's commit can't land in another's transaction
+        self._lock = threading.RLock()
 
+    @_locked
     def connect(self) -> None:
         """Connect to the database and create tables if needed."""
-        self._conn = sqlite3.connect(str(self.db_path))
+        # Saved-table writes are run in a worker thread by the server;
+        # every method serializes access through self._lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         self._create_tables()
 
+    @_locked
     def close(self) -> None:
         """Close the database connection."""
         if self._conn:
@@ -147,6 +167,7 @@ class Database:
 
     # User operations
 
+    @_locked
     def get_user(self, username: str) -> UserRecord | None:
         """Get a user by username."""
         cursor = self._conn.cursor()
@@ -166,6 +187,7 @@ class Database:
             )
         return None
 
+    @_locked
     def create_user(
         self, username: str, password_hash: str, locale: str = "en"
     ) -> UserRecord:
@@ -186,12 +208,14 @@ class Database:
             locale=locale,
         )
 
+    @_locked
     def user_exists(self, username: str) -> bool:
         """Check if a user exists."""
         cursor = self._conn.cursor()
         cursor.execute("SELECT 1 FROM users WHERE username = ?", (username,))
         return cursor.fetchone() is not None
 
+    @_locked
     def update_user_locale(self, username: str, locale: str) -> None:
         """Update a user's locale."""
         cursor = self._conn.cursor()
@@ -200,6 +224,7 @@ class Database:
         )
         self._conn.commit()
 
+    @_locked
     def update_user_preferences(self, username: str, preferences_json: str) -> None:
         """Update a user's preferences."""
         cursor = self._conn.cursor()
@@ -209,6 +234,7 @@ class Database:
         )
         self._conn.commit()
 
+    @_locked
     def update_user_password(self, username: str, password_hash: str) -> None:
         """Update a user's password hash."""
         cursor = self._conn.cursor()
@@ -220,6 +246,7 @@ class Database:
 
     # Table operations
 
+    @_locked
     def save_table(self, table: Table) -> None:
         """Save a table to the database."""
         cursor = self._conn.cursor()
@@ -228,7 +255,7 @@ class Database:
         members_json = json.dumps(
             [
                 {"username": m.username, "is_spectator": m.is_spectator}
-                for m in table.members
+                for m in table.members.values()
             ]
         )
 
@@ -248,6 +275,7 @@ class Database:
         )
         self._conn.commit()
 
+    @_locked
     def load_table(self, table_id: str) -> Table | None:
         """Load a table from the database."""
         cursor = self._conn.cursor()
@@ -260,10 +288,12 @@ class Database:
         members_data = json.loads(row["members_json"])
         from ..tables.table import TableMember
 
-        members = [
-            TableMember(username=m["username"], is_spectator=m["is_spectator"])
+        members = {
+            m["username"]: TableMember(
+                username=m["username"], is_spectator=m["is_spectator"]
+            )
             for m in members_data
-        ]
+        }
 
         return Table(
             table_id=row["table_id"],
@@ -274,6 +304,7 @@ class Database:
             status=row["status"],
         )
 
+    @_locked
     def load_all_tables(self) -> list[Table]:
         """Load all tables from the database."""
         cursor = self._conn.cursor()
@@ -285,18 +316,21 @@ class Database:
                 tables.append(table)
         return tables
 
+    @_locked
     def delete_table(self, table_id: str) -> None:
         """Delete a table from the database."""
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM tables WHERE table_id = ?", (table_id,))
         self._conn.commit()
 
+    @_locked
     def delete_all_tables(self) -> None:
         """Delete all tables from the database."""
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM tables")
         self._conn.commit()
 
+    @_locked
     def save_all_tables(self, tables: list[Table]) -> None:
         """Save multiple tables."""
         for table in tables:
@@ -304,6 +338,7 @@ class Database:
 
     # Saved table operations (user-saved game states)
 
+    @_locked
     def save_user_table(
         self,
         username: str,
@@ -318,14 +353,19 @@ class Database:
         saved_at = datetime.now().isoformat()
 
         cursor = self._conn.cursor()
-        cursor.execute(
-            """
+        try:
+            cursor.execute(
+                """
             INSERT INTO saved_tables (username, save_name, game_type, game_json, members_json, saved_at)
             VALUES (?, ?, ?, ?, ?, ?)
         """,
-            (username, save_name, game_type, game_json, members_json, saved_at),
-        )
-        self._conn.commit()
+                (username, save_name, game_type, game_json, members_json, saved_at),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            # Don't leave a half-done insert open for the next caller
+            self._conn.rollback()
+            raise
 
         return SavedTableRecord(
             id=cursor.lastrowid,
@@ -337,6 +377,7 @@ class Database:
             saved_at=saved_at,
         )
 
+    @_locked
     def get_user_saved_tables(self, username: str) -> list[SavedTableRecord]:
         """Get all saved tables for a user."""
         cursor = self._conn.cursor()
@@ -359,6 +400,7 @@ class Database:
             )
         return records
 
+    @_locked
     def get_saved_table(self, save_id: int) -> SavedTableRecord | None:
         """Get a saved table by ID."""
         cursor = self._conn.cursor()
@@ -377,6 +419,7 @@ class Database:
             saved_at=row["saved_at"],
         )
 
+    @_locked
     def delete_saved_table(self, save_id: int) -> None:
         """Delete a saved table."""
         cursor = self._conn.cursor()
@@ -385,6 +428,7 @@ class Database:
 
     # Game result operations (statistics)
 
+    @_locked
     def save_game_result(
         self,
         game_type: str,
@@ -436,6 +480,7 @@ class Database:
         self._conn.commit()
         return result_id
 
+    @_locked
     def get_player_game_history(
         self,
         player_id: str,
@@ -491,6 +536,7 @@ class Database:
             })
         return results
 
+    @_locked
     def get_game_result_players(self, result_id: int) -> list[dict]:
         """Get all players for a specific game result."""
         cursor = self._conn.cursor()
@@ -511,6 +557,7 @@ class Database:
             for row in cursor.fetchall()
         ]
 
+    @_locked
     def get_game_stats(self, game_type: str, limit: int | None = None) -> list[tuple]:
         """
         Get game results for a game type.
@@ -551,6 +598,7 @@ class Database:
             for row in cursor.fetchall()
         ]
 
+    @_locked
     def get_game_stats_aggregate(self, game_type: str) -> dict:
         """
         Get aggregate statistics for a game type.
@@ -577,6 +625,7 @@ class Database:
             "avg_duration_ticks": row["avg_duration"] or 0,
         }
 
+    @_locked
     def get_player_stats(self, player_id: str, game_type: str | None = None) -> dict:
         """
         Get statistics for a player.
@@ -617,6 +666,7 @@ class Database:
 
     # Player rating operations
 
+    @_locked
     def get_player_rating(
         self, player_id: str, game_type: str
     ) -> tuple[float, float] | None:
@@ -639,6 +689,7 @@ class Database:
             return (row["mu"], row["sigma"])
         return None
 
+    @_locked
     def set_player_rating(
         self, player_id: str, game_type: str, mu: float, sigma: float
     ) -> None:
@@ -653,6 +704,7 @@ class Database:
         )
         self._conn.commit()
 
+    @_locked
     def get_rating_leaderboard(
         self, game_type: str, limit: int = 10
     ) -> list[tuple[str, float, float]]:
@@ -14,6 +14,7 @@ class TableManager:
 
     def __init__(self):
         self._tables: dict[str, Table] = {}
+        self._user_tables: dict[str, str] = {}  # username -> table_id
         self._server: Any = None  # Reference to server for destroy/save notifications
 
     def create_table(
@@ -43,7 +44,10 @@ class TableManager:
 
     def remove_table(self, table_id: str) -> None:
         """Remove a table."""
-        self._tables.pop(table_id, None)
+        table = self._tables.pop(table_id, None)
+        if table:
+            for username in table.members:
+                self.on_member_removed(table, username)
 
     def get_all_tables(self) -> list[Table]:
         """Get all tables."""
@@ -62,11 +66,19 @@ class TableManager:
 
     def find_user_table(self, username: str) -> Table | None:
         """Find the table a user is currently in."""
-        for table in self._tables.values():
-            for member in table.members:
-                if member.username == username:
-                    return table
-        return None
+        table_id = self._user_tables.get(username)
+        if table_id is None:
+            return None
+        return self._tables.get(table_id)
+
+    def on_member_added(self, table: Table, username: str) -> None:
+        """Index a new table member. Called by Table.add_member()."""
+        self._user_tables[username] = table.table_id
+
+    def on_member_removed(self, table: Table, username: str) -> None:
+        """Drop a member from the index. Called by Table.remove_member()."""
+        if self._user_tables.get(username) == table.table_id:
+            del self._user_tables[username]
 
     def on_tick(self) -> None:
         """Tick all active tables."""
@@ -80,6 +92,8 @@ class TableManager:
         if self._server:
             table._db = self._server._db
         self._tables[table.table_id] = table
+        for username in table.members:
+            self.on_member_added(table, username)
 
     def save_all(self) -> list[Table]:
         """Save all tables' game state and return them."""
@@ -30,7 +30,7 @@ class Table(DataClassJSONMixin):
     table_id: str
     game_type: str
     host: str
-    members: list[TableMember] = field(default_factory=list)
+    members: dict[str, TableMember] = field(default_factory=dict)  # username -> member
     game_json: str | None = None  # Serialized game state
     status: str = "waiting"  # waiting, playing, finished
 
@@ -54,26 +54,29 @@ class Table(DataClassJSONMixin):
 
     @game.setter
     def game(self, value: "Game | None") -> None:
+        # game_json is refreshed by save_game_state() before persisting, so
+        # don't serialize here (on restore the game was just parsed from it)
         self._game = value
-        if value:
-            self.game_json = value.to_json()
 
     def add_member(
         self, username: str, user: "User", as_spectator: bool = False
     ) -> None:
         """Add a member to the table."""
         # Check if already a member
-        for member in self.members:
-            if member.username == username:
-                return
+        if username in self.members:
+            return
 
-        self.members.append(TableMember(username=username, is_spectator=as_spectator))
+        self.members[username] = TableMember(username=username, is_spectator=as_spectator)
         self._users[username] = user
+        if self._manager:
+            self._manager.on_member_added(self, username)
 
     def remove_member(self, username: str) -> None:
         """Remove a member from the table."""
-        self.members = [m for m in self.members if m.username != username]
+        self.members.pop(username, None)
         self._users.pop(username, None)
+        if self._manager:
+            self._manager.on_member_removed(self, username)
 
     def get_user(self, username: str) -> "User | None":
         """Get a user by username."""
@@ -85,11 +88,11 @@ class Table(DataClassJSONMixin):
 
     def get_players(self) -> list[TableMember]:
         """Get all non-spectator members."""
-        return [m for m in self.members if not m.is_spectator]
+        return [m for m in self.members.values() if not m.is_spectator]
 
     def get_spectators(self) -> list[TableMember]:
         """Get all spectator members."""
-        return [m for m in self.members if m.is_spectator]
+        return [m for m in self.members.values() if m.is_spectator]
 
     @property
     def player_count(self) -> int:
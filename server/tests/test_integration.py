@@ -73,7 +73,7 @@ class TestDatabaseIntegration:
         assert loaded.game_type == "pig"
         assert loaded.host == "testhost"
         assert len(loaded.members) == 1
-        assert loaded.members[0].username == "testhost"
+        assert loaded.members["testhost"].username == "testhost"
 
     def test_table_with_game_state(self):
         """Test saving and loading table with game state."""
@@ -109,6 +109,73 @@ class TestDatabaseIntegration:
         assert loaded_game.round == 3
         assert loaded_game.get_player_score(loaded_game.players[0]) == 25
 
+    def test_saved_tables_from_worker_threads(self):
+        """Test concurrent saved-table writes each commit their own row."""
+        import threading
+
+        def save(i):
+            self.db.save_user_table("host", f"save {i}", "pig", "{}", "[]")
+
+        threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        saves = self.db.get_user_saved_tables("host")
+        assert len({record.id for record in saves}) == 8
+
+
+class TestTableSaveIntegration:
+    """Test saving a table from the server."""
+
+    def setup_method(self):
+        """Create a server with a temporary database and one playing table."""
+        from server.core.server import Server
+
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.server = Server(db_path=self.temp_file.name)
+        self.host = MockUser("Host")
+        self.table = self.server._tables.create_table("pig", "Host", self.host)
+        self.game = PigGame()
+        self.game.add_player("Host", self.host)
+        self.table.game = self.game
+        self.game._table = self.table
+
+    def teardown_method(self):
+        """Clean up temporary database."""
+        self.server._db.close()
+        os.unlink(self.temp_file.name)
+
+    def test_table_destroyed_after_save(self):
+        """Test the table closes only after its save is in the database."""
+        import asyncio
+
+        self.server._db.connect()
+
+        async def save_and_wait():
+            self.server.on_table_save(self.table, "Host")
+            assert self.server._tables.get_table(self.table.table_id) is self.table
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            await asyncio.gather(*pending)
+
+        asyncio.run(save_and_wait())
+        assert len(self.server._db.get_user_saved_tables("Host")) == 1
+        assert self.server._tables.get_table(self.table.table_id) is None
+        assert "Table saved! Returning to main menu." in self.host.get_spoken_messages()
+
+    def test_failed_save_keeps_table(self):
+        """Test a failed save reports the error and leaves the table open."""
+        # Never connected, so the write fails
+        self.server._users["Host"] = self.host
+        self.server.on_table_save(self.table, "Host")
+
+        assert self.server._tables.get_table(self.table.table_id) is self.table
+        assert self.host.get_spoken_messages()[-1] == (
+            "Could not save the table. Your game is still open."
+        )
+
 
 class TestAuthIntegration:
     """Test authentication system."""
@@ -175,6 +242,19 @@ class TestTableManagerIntegration:
         user_table = manager.find_user_table("host")
         assert user_table is table
 
+    def test_find_user_table_tracks_membership(self):
+        """Test that user lookup follows members joining, leaving and table removal."""
+        manager = TableManager()
+        table = manager.create_table("pig", "host", MockUser("host"))
+        table.add_member("guest", MockUser("guest"))
+        assert manager.find_user_table("guest") is table
+
+        table.remove_member("guest")
+        assert manager.find_user_table("guest") is None
+
+        manager.remove_table(table.table_id)
+        assert manager.find_user_table("host") is None
+
     def test_waiting_tables(self):
         """Test getting waiting tables."""
         manager = TableManager()
@@ -211,6 +291,13 @@ class TestGameRegistryIntegration:
         assert "category-dice-games" in categories
         assert PigGame in categories["category-dice-games"]
 
+    def test_get_all_loads_every_game(self):
+        """Test that listing games imports and registers all known games in order."""
+        from server.games.registry import GAME_MODULES
+
+        game_types = [game_class.get_type() for game_class in GameRegistry.get_all()]
+        assert game_types == list(GAME_MODULES)
+
 
 class TestFullGameFlow:
     """Test complete game flow from creation to completion."""
@@ -11,7 +11,7 @@ from server.games.milebymile.game import (
     MileByMileOptions,
     RaceState,
 )
-from server.games.milebymile.cards import HazardType, SafetyType
+from server.games.milebymile.cards import Card, CardType, HazardType, SafetyType
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -52,6 +52,93 @@ class TestMileByMileGameUnit:
         assert game.options.round_distance == 700
         assert game.options.winning_score == 3000
 
+    def test_hazard_state_builds_targets_only_for_menu(self):
+        """Test hazard targets are listed only when a target menu is needed."""
+        game = MileByMileGame()
+        for name in ("Alice", "Bob", "Carol"):
+            game.add_player(name, MockUser(name))
+        game.on_start()
+        alice = game.players[0]
+
+        assert game._compute_hazard_state(alice, HazardType.SPEED_LIMIT) == (
+            True,
+            [1, 2],
+        )
+
+        game.race_states[2].add_problem(HazardType.SPEED_LIMIT)
+        assert game._compute_hazard_state(alice, HazardType.SPEED_LIMIT) == (
+            True,
+            None,
+        )
+
+        game.race_states[1].add_problem(HazardType.SPEED_LIMIT)
+        assert game._compute_hazard_state(alice, HazardType.SPEED_LIMIT) == (
+            False,
+            None,
+        )
+
+    def test_hazard_target_menu_uses_team_ids(self):
+        """Test hazard target options are team IDs with display labels."""
+        game = MileByMileGame()
+        for name in ("Alice", "Bob", "Carol"):
+            game.add_player(name, MockUser(name))
+        game.on_start()
+        alice = game.players[0]
+        game.race_states[2].miles = 75
+
+        alice.hand[0] = Card(id=999, card_type=CardType.HAZARD, value=HazardType.SPEED_LIMIT)
+        game._pending_actions[alice.id] = "card_slot_1"
+        options = game._hazard_target_options(alice)
+        assert options == ["hazard_target_1", "hazard_target_2"]
+        assert game._get_hazard_target_label(alice, options[1]) == "Carol (75 miles)"
+        assert game._bot_select_hazard_target(alice, options) == "hazard_target_2"
+
+        assert game._parse_hazard_target("hazard_target_0") == 0
+        assert game._parse_hazard_target("hazard_target_3") is None
+        assert game._parse_hazard_target("Carol (75 miles)") is None
+
+    def test_karma_clash_announced_by_role(self):
+        """Test karma clash messages go to attacker, target and others by role."""
+        game = MileByMileGame()
+        users = [MockUser(name) for name in ("Alice", "Bob", "Carol")]
+        for user in users:
+            game.add_player(user.username, user)
+        game.on_start()
+        for user in users:
+            user.clear_messages()
+
+        game._announce_karma_clash(game.players[0], 0, 1)
+        alice, bob, carol = (user.get_spoken_messages()[-1] for user in users)
+        assert alice == "You and your target are both shunned! The attack is neutralized."
+        assert bob == "You and Alice are both shunned! The attack is neutralized."
+        assert carol == "Alice and Bob are both shunned! The attack is neutralized."
+
+    def test_bot_stops_scoring_at_perfect_finish(self):
+        """Test a bot takes a perfect finish without scoring the rest of its hand."""
+        game = MileByMileGame()
+        for name in ("Alice", "Bob"):
+            game.add_player(name, MockUser(name))
+        game.on_start()
+        alice = game.players[0]
+        race_state = game.race_states[0]
+        race_state.remove_problem(HazardType.STOP)
+        race_state.miles = game.options.round_distance - 100
+
+        alice.hand = [
+            Card(id=900 + i, card_type=CardType.DISTANCE, value=value)
+            for i, value in enumerate(("25", "100", "75", "50"))
+        ]
+        scored = []
+        score_card = game._bot_score_card
+
+        def counting_score(player, card, turn):
+            scored.append(card.value)
+            return score_card(player, card, turn)
+
+        game._bot_score_card = counting_score
+        assert game._bot_choose_card(alice) == "card_slot_2"
+        assert scored == ["25", "100"]
+
 
 class TestRightOfWayBehavior:
     """Tests for Right of Way safety card behavior."""
@@ -115,6 +202,38 @@ class TestRightOfWayBehavior:
         assert race_state.can_play_distance() is False
 
 
+    def test_critical_problems_survive_round_trip(self):
+        """Critical problem tracking should match problems after add/remove/reload."""
+        race_state = RaceState()
+        race_state.add_problem(HazardType.SPEED_LIMIT)
+        assert race_state.has_any_problem() is False
+
+        race_state.add_problem(HazardType.ACCIDENT)
+        assert race_state.has_any_problem() is True
+
+        loaded = RaceState.from_json(race_state.to_json())
+        assert loaded.has_any_problem() is True
+
+        loaded.remove_problem(HazardType.ACCIDENT)
+        assert loaded.has_any_problem() is False
+
+    def test_battle_pile_loads_from_embedded_cards(self):
+        """Saves with whole cards in battle/protection piles should load as card IDs."""
+        old = {
+            "battle_pile": [
+                {"id": 7, "card_type": "hazard", "value": "stop"},
+                {"id": 12, "card_type": "remedy", "value": "roll"},
+            ]
+        }
+        assert RaceState.from_dict(old).battle_pile == [7, 12]
+
+        game = MileByMileGame()
+        data = game.to_dict()
+        data["protections_pile"] = [
+            {"id": 3, "card_type": "safety", "value": "driving_ace"}
+        ]
+        assert MileByMileGame.from_dict(data).protections_pile == [3]
+
 class TestMileByMileSerialization:
     """Tests for game serialization."""
 
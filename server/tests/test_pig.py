@@ -38,6 +38,19 @@ class TestPigGameUnit:
         assert player.round_score == 0
         assert player.is_bot is False
 
+    def test_player_lookup_follows_leave(self):
+        """Test that player lookups reflect players joining and leaving."""
+        game = PigGame()
+        alice = game.add_player("Alice", MockUser("Alice"))
+        assert game.get_player_by_id(alice.id) is alice
+
+        bob = game.add_player("Bob", MockUser("Bob"))
+        assert game.get_player_by_name("Bob") is bob
+
+        game._action_leave_game(bob, "leave_game")
+        assert game.get_player_by_id(bob.id) is None
+        assert game.get_player_by_name("Bob") is None
+
     def test_options_defaults(self):
         """Test default game options."""
         game = PigGame()
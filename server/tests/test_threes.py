@@ -42,6 +42,24 @@ class TestThreesGameUnit:
         game = ThreesGame(options=options)
         assert game.options.total_rounds == 10
 
+    def test_keep_by_value_skips_kept_and_locked(self):
+        """Test that keeping by face value picks the first free matching die."""
+        game = ThreesGame()
+        player = game.add_player("Alice", MockUser("Alice"))
+        dice = player.dice
+        dice.values = [4, 4, 2, 4, 6]
+        dice.locked = [0]
+        dice.kept = [0]
+
+        game._keep_by_value(player, 4)
+        assert dice.kept == [0, 1]
+
+        game._keep_by_value(player, 4)
+        assert dice.kept == [0, 1, 3]
+
+        game._unkeep_by_value(player, 4)
+        assert dice.kept == [0, 3]
+
     def test_serialization(self):
         """Test that game state can be serialized and deserialized."""
         game = ThreesGame()